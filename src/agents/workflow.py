@@ -50,7 +50,7 @@ def run_workflow(job: Job, config):
             print(f"Content generation attempt {attempt + 1}/3...")
 
             resume_suggestions, cover_letter = generation_agent.generate_content(
-                job, config, ideal_job_profile_content,
+                job, config,
                 previous_rejection_reason=rejection_reason, 
                 is_last_chance=(attempt==2)
             )
@@ -62,6 +62,8 @@ class Config:
         
         # Global settings
         self.headless = os.getenv("HEADLESS", "false").lower() == "true"
+        self.chrome_profile_dir = os.getenv("CHROME_PROFILE_DIR")
+        self.seen_jobs_path = os.getenv("SEEN_JOBS_PATH")
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
         self.telegram_api_key = os.getenv("TELEGRAM_API_KEY")
         self.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
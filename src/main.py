@@ -1,8 +1,11 @@
 # This is the main orchestrator for the AI-Powered Job Scraper.
 
 import time
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import subprocess
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -103,10 +106,11 @@ def get_chrome_options_tier3():
     options.add_argument("--max_old_space_size=4096")
     return options
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+def setup_chrome_driver(headless: bool = True, profile_dir: str = None) -> webdriver.Chrome:
     """
     Set up Chrome WebDriver with comprehensive Docker optimizations and fallback strategies.
     Optimized for GitHub Actions and containerized environments.
+    If profile_dir is given, Chrome keeps its profile (and so its cookies) there between runs.
     """
     
     # Environment detection
@@ -147,6 +151,10 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
             if headless and not any('--headless' in arg for arg in chrome_options.arguments):
                 chrome_options.add_argument("--headless=new")
             
+            # Reuse a persistent profile so the LinkedIn session outlives the process
+            if profile_dir:
+                chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+            
             # Create service
             service = Service()
             
@@ -207,7 +215,8 @@ def scrape_platform_jobs(driver: webdriver.Chrome, platform_name: str, urls: lis
             'cookies_path': platform_config.get_auth_setting('cookies_path', 'cookies.json'),
             'linkedin_email': platform_config.get_auth_setting('email'),
             'linkedin_password': platform_config.get_auth_setting('password'),
-            'notifier': notifier
+            'notifier': notifier,
+            'seen_jobs_path': config.seen_jobs_path
         })
     
     scraper = ScraperFactory.create_scraper(
@@ -259,19 +268,39 @@ def scrape_platform_jobs(driver: webdriver.Chrome, platform_name: str, urls: lis
     return all_jobs
 
 
+_log_listener = None
+
+
+def setup_logging():
+    """
+    Hand log records to a background thread so console I/O never blocks the scraper.
+    Only the first call starts the listener; later calls reuse it.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
 def main():
     """
     The main function to run the AI-Powered Job Scraper with multi-platform support.
     """
     import os
     
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    setup_logging()
 
     config = load_config()
     
     # Set up WebDriver
-    driver = setup_chrome_driver(headless=config.headless)
+    driver = setup_chrome_driver(headless=config.headless, profile_dir=config.chrome_profile_dir)
     
     try:
         # Set up notification service
@@ -322,7 +351,7 @@ def main():
                         # Add a delay between notifications to avoid rate limiting
                         time.sleep(5)
 
-        print("AI-Powered Job Scraper finished successfully.")
+        logging.info("AI-Powered Job Scraper finished successfully.")
         
     except Exception as e:
         logging.error(f"An error occurred in the main workflow: {e}", exc_info=True)
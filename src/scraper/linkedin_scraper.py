@@ -1,9 +1,16 @@
 import time
+import html
 import json
+import os
 import re
-from typing import Iterator
-from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator
+from urllib.parse import urlparse
 import logging
+from functools import cached_property
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,13 +18,445 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
-    ElementClickInterceptedException,
     InvalidSessionIdException,
+    StaleElementReferenceException,
 )
 
+try:
+    import orjson  # Optional: faster parsing of large exported cookie files
+except ImportError:
+    orjson = None
+
 from .base import BaseScraper
-from .models import Job
+from .models import Job, RawJob
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn job id, from a search page URL with a job card opened or a /jobs/view/ URL
+_JOB_ID_RE = re.compile(r'(?:[?&]currentJobId=|/view/)(\d+)')
+
+# Detail panel tertiary line: "City, State · 2 weeks ago · 100 applicants", later parts
+# optional; any further parts ("Promoted by hirer", ...) are ignored
+_TERTIARY_RE = re.compile(r'^(?P<loc>[^·]+?)(?:\s*·\s*(?P<posted>[^·]+?))?(?:\s*·\s*(?P<applicants>[^·]+?))?(?:\s*·.*)?\s*$')
+
+# Posting age units, largest first, as the detail panel words them ("2 weeks ago")
+_POSTED_AGO_UNITS = (("month", 30 * 86400), ("week", 7 * 86400), ("day", 86400), ("hour", 3600), ("minute", 60))
+
+# Consecutive Voyager batches with no usable posting before the API is given up on
+_VOYAGER_MAX_EMPTY_BATCHES = 3
+
+# Canonical posting URL for a job id, free of search and tracking query params
+_JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+
+# Timestamp format for the auth failure notification (rendered from time.gmtime())
+_TS_FMT = '%Y-%m-%d %H:%M:%S UTC'
+
+# Serializes seen-jobs file updates between scrape_many() workers
+_SEEN_JOBS_LOCK = threading.Lock()
+
+# WebDriverWait poll interval in seconds; Selenium's 0.5s default adds up to half a
+# second of latency to every wait that's satisfied between polls
+_POLL_FREQUENCY = 0.1
+
+# How many jobs to process between session heartbeat checks
+_SESSION_CHECK_INTERVAL = 5
+
+# Result cards opened per browser round-trip in _SCRAPE_CARDS_JS
+_CARD_BATCH_SIZE = 5
+
+# Worst case for one card in _SCRAPE_CARDS_JS, in seconds: the 4s panel wait, the 1s
+# "see more" wait, and slack for scrolling, clicking and reading the panel
+_CARD_SCRAPE_MAX_SECONDS = 6
+
+# Async script timeout in seconds, set on the driver so a full card batch can't run into
+# Selenium's 30s default and drop every job in it
+_SCRIPT_TIMEOUT = _CARD_BATCH_SIZE * _CARD_SCRAPE_MAX_SECONDS + 10
+
+# Hides the automation properties sites use to detect WebDriver. Registered once per
+# session via CDP so Chrome injects it at document start on every navigation.
+# Limited to the properties LinkedIn's bot detection actually probes.
+_STEALTH_JS = """
+// Override navigator.webdriver property
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+
+// Remove webdriver property
+delete navigator.__proto__.webdriver;
+
+// Override plugins and languages to appear more realistic
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+"""
+
+# Resource types the scraper never reads; blocked so LinkedIn pages load only what's parsed
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+]
+
+# Reports the login state of the current page in one round-trip instead of
+# transferring page_source and probing selectors one by one
+_AUTH_STATE_JS = """
+return (function () {
+    const visible = (el) => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const anyVisible = (selector) => Array.from(document.querySelectorAll(selector)).some(visible);
+    const path = location.pathname.toLowerCase();
+    // Every match is checked: the first may be hidden (<title>, a script, a template)
+    const welcome = document.evaluate(
+        "//*[contains(text(), 'Welcome back')]", document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const welcomeNodes = Array.from({length: welcome.snapshotLength}, (_, i) => welcome.snapshotItem(i));
+    return {
+        loggedIn: anyVisible(
+            ".global-nav__primary-items, .global-nav__nav, [data-control-name='nav.homepage']"
+        ),
+        needsPassword: anyVisible(
+            "input[name='session_password'], input[type='password'], #password"
+        ),
+        welcomeBack: welcomeNodes.some(visible),
+        onLogin: path.includes("login"),
+        onChallenge: path.includes("checkpoint") || path.includes("challenge"),
+    };
+})();
+"""
+
+# Login form lookups, each a single comma-union so the browser matches them in one query
+_EMAIL_FIELD_CSS = "input[name='session_key'], input[id='username'], input[type='email'], input[autocomplete='username']"
+_PASSWORD_FIELD_CSS = "input[name='session_password'], input[type='password'], input[id*='password']"
+_SIGNIN_BUTTON_CSS = (
+    "button[data-litms-control-urn='login-submit'], button[type='submit'], "
+    ".login__form_action_container button, input[type='submit']"
+)
+# ':contains()' isn't valid CSS, so the text match is an XPath fallback
+_SIGNIN_BUTTON_XPATH = "//button[contains(normalize-space(.), 'Sign in')]"
+
+# sameSite values browsers accept; some cookie-export extensions write others
+_ALLOWED_SAMESITE = frozenset(("Strict", "Lax", "None"))
+
+# Cookie attributes accepted by CDP's Network.setCookies
+_CDP_COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+def _to_cdp_cookie(cookie: dict) -> dict:
+    """
+    Convert an exported/Selenium-style cookie dict into a CDP CookieParam.
+    Drops unknown keys and invalid 'sameSite' values, and maps expiry to 'expires'.
+    """
+    cdp_cookie = {k: v for k, v in cookie.items() if k in _CDP_COOKIE_KEYS}
+    if cdp_cookie.get("sameSite") not in _ALLOWED_SAMESITE:
+        cdp_cookie.pop("sameSite", None)
+    expiry = cookie.get("expiry", cookie.get("expirationDate"))
+    if "expires" not in cdp_cookie and expiry is not None:
+        cdp_cookie["expires"] = expiry
+    if "domain" not in cdp_cookie:
+        cdp_cookie["url"] = "https://www.linkedin.com"
+    return cdp_cookie
+
+
+def finalize_job(raw: RawJob) -> Job:
+    """
+    Turn raw detail panel fields into a Job by splitting the tertiary line.
+    Pure CPU work with no driver access.
+    """
+    # The tertiary container holds location, posting age and applicant count in one line
+    tertiary = _TERTIARY_RE.match(raw.tertiary)
+    location = tertiary.group('loc').strip() if tertiary else raw.tertiary.split('·')[0].strip()
+    job = Job(
+        title=raw.title,
+        company=raw.company,
+        location=location,
+        description=raw.description_html,
+        url=raw.url,
+        search_url=raw.search_url,
+        platform="linkedin",
+        posted_date=tertiary.group('posted') if tertiary else None
+    )
+    job.set_platform_field('applicants_raw', tertiary.group('applicants') if tertiary else None)
+    return job
+
+
+def _posted_ago(listed_at_ms: int, now: float = None) -> str:
+    """
+    Render a Voyager listedAt timestamp (epoch milliseconds) the way the detail panel
+    shows a posting's age, e.g. "3 days ago".
+    """
+    seconds = max(0.0, (time.time() if now is None else now) - listed_at_ms / 1000)
+    for unit, size in _POSTED_AGO_UNITS:
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    return "Just now"
+
+
+def _voyager_tertiary(job: dict) -> str:
+    """
+    Build the detail panel's tertiary line ("location · posted · applicants") from a
+    Voyager job, so finalize_job fills the same fields whichever path read the job.
+    """
+    parts = [job["location"]]
+    # The line is positional, so the applicant count only goes in after a posting age
+    if job.get("listedAt"):
+        parts.append(_posted_ago(job["listedAt"]))
+        if job.get("applies") is not None:
+            parts.append(f"{job['applies']} applicant{'s' if job['applies'] != 1 else ''}")
+    return " · ".join(parts)
+
+
+# URL path prefixes and fragments that classify where a login attempt ended up. Matched
+# against the path only: login and checkpoint URLs carry the target page in their query
+# string (session_redirect=...%2Ffeed)
+_LOGGED_IN_PATH_PREFIXES = ("/feed", "/in/")
+_LOGIN_PATH_PREFIXES = ("/login", "/uas/login")
+_CHALLENGE_URL_PATTERNS = ("challenge", "checkpoint")
+_POST_LOGIN_URL_PATTERNS = ("/feed",) + _CHALLENGE_URL_PATTERNS
+
+
+def _url_path(url: str) -> str:
+    """Lower-cased path of a URL, without the query string or fragment."""
+    return urlparse(url).path.lower()
+
+# Returns the first rendered element matching arguments[0] (CSS), else arguments[1] (XPath),
+# so picking a visible candidate costs one round-trip instead of one is_displayed() per match
+_FIND_VISIBLE_JS = """
+const visible = (node) => {
+    const rect = node.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+for (const node of document.querySelectorAll(arguments[0])) {
+    if (visible(node)) return node;
+}
+if (arguments[1]) {
+    const snapshot = document.evaluate(
+        arguments[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        if (visible(snapshot.snapshotItem(i))) return snapshot.snapshotItem(i);
+    }
+}
+return null;
+"""
+
+# Fills and submits the login form in one round-trip. Arguments: email (null to leave the
+# email field alone), password, then the email/password/button CSS selectors.
+_SUBMIT_LOGIN_JS = """
+const [email, password, emailCss, passwordCss, buttonCss] = arguments;
+const pick = (selector) => Array.from(document.querySelectorAll(selector)).find((node) => {
+    const rect = node.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+});
+const setValue = (input, value) => {
+    input.focus();
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+};
+const emailInput = email === null ? null : pick(emailCss);
+const passwordInput = pick(passwordCss);
+const button = pick(buttonCss);
+if ((email !== null && !emailInput) || !passwordInput || !button) return false;
+if (emailInput) setValue(emailInput, email);
+setValue(passwordInput, password);
+button.click();
+return true;
+"""
+
+# Search results (or a sign-in modal blocking them) have rendered
+_SEARCH_PAGE_READY_SELECTORS = (".job-card-container", ".artdeco-list li", ".contextual-sign-in-modal", ".auth-modal")
+
+# JS helper returning the LinkedIn job id of a result card, shared by the scripts below
+_CARD_JOB_ID_FN = """
+const cardJobId = (card) => {
+    const inner = card.querySelector('[data-job-id]');
+    return card.dataset.jobId || card.dataset.occludableJobId || (inner && inner.dataset.jobId) || null;
+};
+"""
+
+# Job ids of every result card matching CSS selector arguments[0], in list order
+_CARD_JOB_IDS_JS = _CARD_JOB_ID_FN + """
+return Array.from(document.querySelectorAll(arguments[0]), cardJobId);
+"""
+
+# Summary fields of the result cards at indices arguments[1] of the list matching CSS
+# selector arguments[0], read straight from the list DOM without opening any detail panel
+_LIST_CARDS_JS = _CARD_JOB_ID_FN + """
+const text = (root, sel) => {
+    const node = root.querySelector(sel);
+    return node ? node.innerText.trim() : null;
+};
+const cards = document.querySelectorAll(arguments[0]);
+return arguments[1].filter(i => i < cards.length).map(i => {
+    const card = cards[i];
+    const jobId = cardJobId(card);
+    const link = card.querySelector('a.job-card-list__title, a.job-card-container__link');
+    return {
+        id: jobId,
+        title: link ? link.innerText.trim() : null,
+        company: text(card, '.job-card-container__primary-description, .artdeco-entity-lockup__subtitle'),
+        location: text(card, '.job-card-container__metadata-item, .artdeco-entity-lockup__caption'),
+        url: jobId ? 'https://www.linkedin.com/jobs/view/' + jobId + '/' : (link ? link.href : null),
+    };
+});
+"""
+
+# Opens the result cards at indices arguments[1] of the list matching CSS selector
+# arguments[0] one after another and reads each detail panel, so a whole batch of jobs
+# costs a single round-trip. arguments[2] holds the job ids snapshotted for those cards;
+# a card is located by its id first so a re-rendered or reordered list still opens the
+# right job. Each entry holds the panel fields (missing ones null), or {error} for a
+# card that failed, including one whose panel never switched to it; the batch stops at
+# the first card that can't be found. A card takes at most _CARD_SCRAPE_MAX_SECONDS,
+# which _SCRIPT_TIMEOUT is sized from.
+_SCRAPE_CARDS_JS = _CARD_JOB_ID_FN + """
+const done = arguments[arguments.length - 1];
+const [selector, indices, jobIds] = arguments;
+const PANEL_SEL = 'div.job-view-layout.jobs-details';
+const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+const text = (root, sel) => {
+    const node = root.querySelector(sel);
+    return node ? node.innerText.trim() : null;
+};
+const panelShows = (jobId) => {
+    const panel = document.querySelector(PANEL_SEL);
+    if (!panel) return false;
+    const tagged = panel.hasAttribute('data-job-id') ? panel : panel.querySelector('[data-job-id]');
+    if (tagged) return tagged.getAttribute('data-job-id') === jobId;
+    return !!panel.querySelector('a[href*="/jobs/view/' + jobId + '"]');
+};
+const panelTitle = () => text(document, PANEL_SEL + ' div.job-details-jobs-unified-top-card__job-title h1');
+const readPanel = async () => {
+    const seeMore = document.querySelector('button.jobs-description__footer-button');
+    if (seeMore) {
+        seeMore.click();
+        // Wait for the description to drop its condensed state rather than a fixed delay
+        for (let waited = 0; document.querySelector('.jobs-description__container--condensed') && waited < 1000; waited += 50) {
+            await sleep(50);
+        }
+    }
+    const panel = document.querySelector(PANEL_SEL) || document;
+    // getElementById is a hash lookup; the id is unique to the panel anyway
+    const description = document.getElementById('job-details');
+    return {
+        title: text(panel, 'div.job-details-jobs-unified-top-card__job-title h1'),
+        company: text(panel, 'div.job-details-jobs-unified-top-card__company-name a'),
+        tertiary: text(panel, 'div.job-details-jobs-unified-top-card__tertiary-description-container'),
+        descriptionHtml: description ? description.innerHTML.trim() : null,
+        url: location.href,
+    };
+};
+const findCard = (index, jobId) => {
+    if (jobId) {
+        const id = CSS.escape(jobId);
+        const byId = document.querySelector(`[data-occludable-job-id="${id}"], [data-job-id="${id}"]`);
+        if (byId) return byId;
+    }
+    const cards = document.querySelectorAll(selector);
+    return index < cards.length ? cards[index] : null;
+};
+(async () => {
+    const results = [];
+    for (let k = 0; k < indices.length; k++) {
+        const card = findCard(indices[k], jobIds[k]);
+        if (!card) break;
+        try {
+            const jobId = jobIds[k] || cardJobId(card);
+            // Without an id, the panel has switched once its title changes or matches the card's
+            const titleBefore = panelTitle();
+            const cardTitle = text(card, 'a[href*="/jobs/view/"]');
+            const switched = () => jobId
+                ? panelShows(jobId)
+                : panelTitle() !== titleBefore || (!!cardTitle && panelTitle() === cardTitle);
+            card.scrollIntoView({block: 'center'});
+            card.click();
+            // Wait up to 4s for the panel to switch to this job. Reading it anyway would
+            // pair the previous job's details with this card's URL.
+            for (let waited = 0; !switched() && waited < 4000; waited += 100) {
+                await sleep(100);
+            }
+            results.push(switched() ? await readPanel() : {error: 'panel did not switch'});
+        } catch (e) {
+            results.push({error: String(e)});
+        }
+    }
+    done(results);
+})();
+"""
+
+# Fetches the postings with ids arguments[0] from LinkedIn's internal Voyager API using
+# the page's own session (JSESSIONID doubles as the CSRF token), all in parallel. Each
+# entry is {title, company, location, description, listedAt, applies}, null if the
+# posting lacks a required field (or the id is empty), or {failed} if the request itself
+# failed. Far cheaper than clicking a card and waiting for the panel to render.
+_VOYAGER_JOBS_JS = """
+const done = arguments[arguments.length - 1];
+const csrf = (document.cookie.match(/JSESSIONID="?([^";]+)/) || [])[1] || '';
+const pick = (job) => {
+    if (!job || !job.title || !job.description || !job.description.text) return null;
+    const company = Object.values(job.companyDetails || {})
+        .map(d => (d.companyResolutionResult || {}).name || d.companyName)
+        .find(Boolean);
+    if (!company) return null;
+    return {
+        title: job.title,
+        company: company,
+        location: job.formattedLocation || '',
+        description: job.description.text,
+        listedAt: job.listedAt || null,
+        applies: Number.isInteger(job.applies) ? job.applies : null,
+    };
+};
+const fetchJob = (id) => fetch(
+    '/voyager/api/jobs/jobPostings/' + encodeURIComponent(id) +
+        '?decorationId=com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65',
+    {headers: {'csrf-token': csrf}, credentials: 'include'}
+).then(r => r.ok ? r.json().then(pick) : {failed: r.status}).catch(e => ({failed: String(e)}));
+Promise.all(arguments[0].map(id => id ? fetchJob(id) : null)).then(done);
+"""
+
+# 'Sign in to view more jobs' modal markers, each merged into one query so the common
+# no-modal case costs two lookups instead of one per selector
+_SIGNIN_MODAL_CSS = (
+    ".contextual-sign-in-modal, .auth-modal, [data-tracking-control-name*='sign-in-modal'], "
+    "button[data-tracking-control-name*='contextual-sign-in'], [role='dialog'][aria-labelledby*='sign']"
+)
+_SIGNIN_MODAL_XPATH = (
+    "//*[contains(text(), 'Sign in to view more jobs') or contains(text(), 'Continue with Google') "
+    "or (contains(text(), 'Sign In') and contains(@class, 'button'))]"
+)
+# Returns whichever of the CSS (arguments[0]) or XPath (arguments[1]) modal queries has a
+# visible match, else null. Structural CSS markers are tried first so the common cases
+# match before the text search, which has to walk the whole document. Visibility uses
+# client rects rather than offsetParent, which is null for fixed-position modals.
+_SIGNIN_MODAL_JS = """
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+if (Array.from(document.querySelectorAll(arguments[0])).some(visible)) return arguments[0];
+const snapshot = document.evaluate(
+    arguments[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    if (visible(snapshot.snapshotItem(i))) return arguments[1];
+}
+return null;
+"""
+
+# Job result cards, with a fallback for the older list markup
+_SEL_JOB_CARDS = (By.CSS_SELECTOR, ".job-card-container")
+_SEL_JOB_CARDS_FALLBACK = (By.CSS_SELECTOR, ".artdeco-list li")
+
+# Pages a cookie login can land on: the 'Welcome back' account picker or the logged-in nav
+_SEL_WELCOME_BACK = (By.XPATH, "//h1[contains(text(), 'Welcome back')]")
+_SEL_GLOBAL_NAV = (By.CSS_SELECTOR, ".global-nav__primary-items")
+
+# Any of these means a LinkedIn page has rendered far enough to tell whether we're logged in
+_AUTH_STATE_SELECTORS = (
+    ".global-nav__primary-items",
+    "input[name='session_key']",
+    "input[name='session_password']",
+)
 
 
 class LinkedInScraper(BaseScraper):
@@ -27,110 +466,55 @@ class LinkedInScraper(BaseScraper):
     """
 
     def __init__(self, driver: webdriver.Chrome, platform_config=None, cookies_path: str = "cookies.json", 
-                 linkedin_email: str = None, linkedin_password: str = None, notifier=None, **kwargs):
+                 linkedin_email: str = None, linkedin_password: str = None, notifier=None,
+                 seen_jobs_path: str = None, **kwargs):
         super().__init__(driver, platform_config, **kwargs)
+        # Rely on explicit WebDriverWait only; an implicit wait would make every
+        # find_element* miss (modal checks, optional buttons) block for its full duration.
+        if self.driver is not None:
+            self.driver.implicitly_wait(0)
+            self.driver.set_script_timeout(_SCRIPT_TIMEOUT)
+            self._install_stealth_script()
+            self._block_heavy_resources()
         self.cookies_path = cookies_path
         self.linkedin_email = linkedin_email
         self.linkedin_password = linkedin_password
         self.notifier = notifier
-        self.wait = WebDriverWait(self.driver, 10)
+        self._cookies_cache = None
+        self._cdp_cookies_cache = None
+        # Cleared once the Voyager job API refuses a whole batch, or returns nothing
+        # usable for _VOYAGER_MAX_EMPTY_BATCHES batches in a row
+        self._voyager_available = True
+        self._voyager_empty_batches = 0
+        # Ids of jobs scraped in earlier runs; their cards are never clicked. Opt-in:
+        # jobs are recorded when scraped, before anything downstream has processed them
+        self.seen_jobs_path = seen_jobs_path
+        self._known_ids = self._load_seen_job_ids()
+        self._waits = {}
         # Don't load cookies at initialization - do it when we actually need authentication
     
-    def _mask_automation_properties(self):
-        """Execute JavaScript to hide automation properties that sites might detect."""
+    def _install_stealth_script(self):
+        """
+        Register the stealth JavaScript with Chrome so it runs before any page script
+        on every new document, instead of re-sending it after each navigation.
+        """
         try:
-            # Override navigator.webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # Override other automation detection properties
-            self.driver.execute_script("""
-                // Remove webdriver property
-                delete navigator.__proto__.webdriver;
-                
-                // Override plugins and languages to appear more realistic
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Override chrome property to appear like regular Chrome
-                Object.defineProperty(navigator, 'chrome', {
-                    get: () => ({
-                        app: {
-                            isInstalled: false,
-                        },
-                        webstore: {
-                            onInstallStageChanged: {},
-                            onDownloadProgress: {},
-                        },
-                        runtime: {
-                            onConnect: {},
-                            onMessage: {},
-                        },
-                    })
-                });
-                
-                // Override permissions property
-                Object.defineProperty(navigator, 'permissions', {
-                    get: () => ({
-                        query: () => Promise.resolve({ state: 'granted' })
-                    })
-                });
-            """)
-            print("Successfully masked automation properties on current page.")
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
+            logger.info("Registered stealth JavaScript for all new documents.")
         except Exception as e:
-            print(f"Warning: Could not mask automation properties: {e}")
+            logger.warning("Could not register stealth JavaScript: %s", e)
     
-    def _reapply_stealth_javascript(self):
-        """Re-apply JavaScript masking on the current page to maintain stealth."""
+    def _block_heavy_resources(self):
+        """
+        Stop Chrome from downloading images, fonts and media. The scraper only reads
+        text and HTML, so these just cost bandwidth and render time on every page.
+        """
         try:
-            # Override navigator.webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # Override other automation detection properties
-            self.driver.execute_script("""
-                // Remove webdriver property
-                delete navigator.__proto__.webdriver;
-                
-                // Override plugins and languages to appear more realistic
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Override chrome property to appear like regular Chrome
-                Object.defineProperty(navigator, 'chrome', {
-                    get: () => ({
-                        app: {
-                            isInstalled: false,
-                        },
-                        webstore: {
-                            onInstallStageChanged: {},
-                            onDownloadProgress: {},
-                        },
-                        runtime: {
-                            onConnect: {},
-                            onMessage: {},
-                        },
-                    })
-                });
-                
-                // Override permissions property
-                Object.defineProperty(navigator, 'permissions', {
-                    get: () => ({
-                        query: () => Promise.resolve({ state: 'granted' })
-                    })
-                });
-            """)
-            print("Re-applied stealth JavaScript for current page.")
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+            logger.info("Blocked image, font and media loading.")
         except Exception as e:
-            print(f"Warning: Could not re-apply stealth JavaScript: {e}")
+            logger.warning("Could not block image/font loading: %s", e)
     
     def authenticate(self) -> bool:
         """
@@ -151,106 +535,109 @@ class LinkedInScraper(BaseScraper):
         
         Returns True if authentication was successful, False otherwise.
         """
-        print("🔐 Starting proactive LinkedIn authentication...")
+        logger.info("🔐 Starting proactive LinkedIn authentication...")
         
         try:
+            # Set the saved cookies before the first page load so a valid session
+            # authenticates on the very first navigation
+            cookies_preloaded = self._preload_session_cookies()
+            
             # First, check if we're already logged in by going to LinkedIn feed
-            print("Checking if already logged in...")
+            logger.info("Checking if already logged in...")
             self.driver.get("https://www.linkedin.com/feed")
-            self._mask_automation_properties()
-            time.sleep(3)
+            self._wait_visible(_AUTH_STATE_SELECTORS, timeout=5)
             
             # Check if we're already logged in (no sign-in prompts on feed)
             if self._is_logged_in():
-                print("✅ Already logged in! No authentication needed.")
+                logger.info("✅ Already logged in! No authentication needed.")
                 return True
             
             # Not logged in, proceed with authentication flow
-            print("Not logged in. Starting authentication process...")
+            logger.info("Not logged in. Starting authentication process...")
             
-            # Step 1: Try to inject cookies first
-            success = self._try_cookie_authentication()
-            if success:
-                print("✅ Cookie authentication successful!")
+            # Step 1: Use the cookies - already applied if preloading worked
+            if cookies_preloaded:
+                if self._check_for_welcome_back_screen():
+                    logger.info("Welcome back screen detected. Completing password login...")
+                    if self._complete_password_login():
+                        logger.info("✅ Cookie authentication successful!")
+                        return True
+            elif self._try_cookie_authentication():
+                logger.info("✅ Cookie authentication successful!")
                 return True
             
             # Step 2: If cookies didn't work, try fresh login flow
-            print("Cookie authentication failed. Attempting fresh login...")
+            logger.info("Cookie authentication failed. Attempting fresh login...")
             success = self._try_fresh_login()
             if success:
-                print("✅ Fresh login successful!")
+                logger.info("✅ Fresh login successful!")
                 return True
                 
-            print("❌ All authentication methods failed.")
+            logger.error("❌ All authentication methods failed.")
             return False
             
         except Exception as e:
-            print(f"❌ Error during proactive authentication: {e}")
+            logger.error("❌ Error during proactive authentication: %s", e)
             return False
     
+    def _preload_session_cookies(self) -> bool:
+        """
+        Set the saved session cookies through CDP without navigating to LinkedIn first.
+        Returns True if the cookies were set, False otherwise.
+        """
+        try:
+            # A persisted Chrome profile may already carry a session; don't clobber it
+            # with the (possibly older) cookies file. If that session turns out to be
+            # dead, the regular cookie authentication step still applies the file.
+            if self._is_session_probably_valid():
+                logger.info("Browser profile already has a LinkedIn session. Skipping cookie pre-load.")
+                return False
+            cookies = self._load_cookie_file()
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": self._cdp_cookies_cache})
+            logger.info("Pre-loaded %d cookies before first navigation.", len(cookies))
+            return True
+        except FileNotFoundError:
+            logger.warning("Cookie file not found at '%s'", self.cookies_path)
+            return False
+        except Exception as e:
+            logger.warning("Could not pre-load cookies: %s", e)
+            return False
+    
+    def _get_auth_state(self) -> dict:
+        """
+        Inspect the current page in a single script execution and report what it shows.
+        Returns a dict with loggedIn, needsPassword, welcomeBack, onLogin and onChallenge flags.
+        """
+        return self.driver.execute_script(_AUTH_STATE_JS)
+    
     def _is_logged_in(self) -> bool:
         """
         Check if we're currently logged in to LinkedIn.
         Returns True if logged in, False otherwise.
         """
         try:
-            # Check for multiple indicators of being logged in
-            current_url = self.driver.current_url
-            page_source = self.driver.page_source.lower()
-            
-            # Look for login indicators - if we see these, we're NOT logged in
-            login_indicators = [
-                "sign in",
-                "log in", 
-                "session_key",
-                "session_password",
-                "join now",
-                "welcome back"
-            ]
-            
-            # Look for logged-in indicators
-            logged_in_indicators = [
-                "global-nav-search",  # Search bar in nav
-                "messaging-", # LinkedIn messaging features
-                "artdeco-button--premium",  # Premium button
-                "profile-photo-edit", # Profile photo edit
-                "feed-nav-item", # Feed navigation
-                '"me":', # JSON data indicating profile
-                "global-nav__primary-item" # Primary navigation items
-            ]
+            state = self._get_auth_state()
             
-            # Check URL patterns that indicate login status
-            if any(pattern in current_url.lower() for pattern in ["login", "checkpoint", "challenge", "uas/login"]):
-                print("❌ On login/challenge page - not logged in")
+            # URL patterns that indicate login status
+            if state["onLogin"] or state["onChallenge"]:
+                logger.info("❌ On login/challenge page - not logged in")
                 return False
             
-            if any(pattern in current_url.lower() for pattern in ["feed", "in/", "mynetwork", "jobs", "me/"]):
-                # On a logged-in page, but double-check content
-                logged_in_content_found = any(indicator in page_source for indicator in logged_in_indicators)
-                login_content_found = any(indicator in page_source for indicator in login_indicators)
-                
-                if logged_in_content_found and not login_content_found:
-                    print("✅ Confirmed logged in based on URL and page content")
-                    return True
-                elif login_content_found:
-                    print("❌ Login forms detected - not properly logged in")
-                    return False
+            if state["needsPassword"]:
+                logger.info("❌ Login forms detected - not properly logged in")
+                return False
             
-            # Fallback: Look for navigation elements that only appear when logged in
-            try:
-                # Try to find the main LinkedIn navigation - this only appears when logged in
-                nav_elements = self.driver.find_elements(By.CSS_SELECTOR, ".global-nav__primary-items, .global-nav__nav, [data-control-name='nav.homepage']")
-                if nav_elements and any(elem.is_displayed() for elem in nav_elements):
-                    print("✅ Found navigation elements - likely logged in")
-                    return True
-            except Exception:
-                pass
+            # The main LinkedIn navigation only appears when logged in
+            if state["loggedIn"]:
+                logger.info("✅ Found navigation elements - logged in")
+                return True
             
-            print("❌ Could not confirm login status - assuming not logged in")
+            logger.info("❌ Could not confirm login status - assuming not logged in")
             return False
             
         except Exception as e:
-            print(f"Error checking login status: {e}")
+            logger.error("Error checking login status: %s", e)
             return False
     
     def _try_cookie_authentication(self) -> bool:
@@ -259,49 +646,41 @@ class LinkedInScraper(BaseScraper):
         Returns True if successful, False otherwise.
         """
         try:
-            print("Attempting cookie authentication...")
+            logger.info("Attempting cookie authentication...")
             
-            # Navigate to login page to inject cookies
-            self.driver.get("https://www.linkedin.com/login")
-            self._reapply_stealth_javascript()
-            time.sleep(2)
-            
-            # Load and inject cookies
+            # Load and inject cookies; CDP sets them from any page, so there's no
+            # need to load a LinkedIn page first
             try:
-                with open(self.cookies_path, "r") as f:
-                    cookies = json.load(f)
+                cookies = self._load_cookie_file()
                 
-                print(f"Loading {len(cookies)} cookies...")
-                for cookie in cookies:
-                    # Sanitize the 'sameSite' attribute if it's invalid
-                    if 'sameSite' in cookie and cookie['sameSite'] not in ["Strict", "Lax", "None"]:
-                        del cookie['sameSite']
-                    self.driver.add_cookie(cookie)
+                logger.info("Loading %d cookies...", len(cookies))
+                self._inject_cookies()
                 
-                print("Cookies loaded. Refreshing page...")
-                self.driver.refresh()
-                time.sleep(3)
+                # Go straight to the feed rather than reloading the login page first
+                logger.info("Cookies loaded. Opening feed...")
+                self.driver.get("https://www.linkedin.com/feed")
+                self._wait_for_welcome_back_or_nav(timeout=5)
                 
                 # Check if we're now on welcome back screen or logged in
                 if self._check_for_welcome_back_screen():
-                    print("Welcome back screen detected. Completing password login...")
+                    logger.info("Welcome back screen detected. Completing password login...")
                     return self._complete_password_login()
                 elif self._is_logged_in():
-                    print("Cookies successful - already logged in!")
+                    logger.info("Cookies successful - already logged in!")
                     return True
                 else:
-                    print("Cookies loaded but still not logged in")
+                    logger.warning("Cookies loaded but still not logged in")
                     return False
                     
             except FileNotFoundError:
-                print(f"Cookie file not found at '{self.cookies_path}'")
+                logger.warning("Cookie file not found at '%s'", self.cookies_path)
                 return False
             except json.JSONDecodeError:
-                print("Invalid JSON in cookie file")
+                logger.warning("Invalid JSON in cookie file")
                 return False
                 
         except Exception as e:
-            print(f"Error during cookie authentication: {e}")
+            logger.error("Error during cookie authentication: %s", e)
             return False
     
     def _try_fresh_login(self) -> bool:
@@ -312,28 +691,27 @@ class LinkedInScraper(BaseScraper):
         """
         try:
             if not self.linkedin_email or not self.linkedin_password:
-                print("❌ Email or password not provided. Cannot perform fresh login.")
-                print(f"Email provided: {bool(self.linkedin_email)}")
-                print(f"Password provided: {bool(self.linkedin_password)}")
+                logger.error("❌ Email or password not provided. Cannot perform fresh login.")
+                logger.info("Email provided: %s", bool(self.linkedin_email))
+                logger.info("Password provided: %s", bool(self.linkedin_password))
                 return False
             
-            print("Attempting fresh login with email and password...")
+            logger.info("Attempting fresh login with email and password...")
             
             # Navigate to login page
             self.driver.get("https://www.linkedin.com/login")
-            self._reapply_stealth_javascript()
-            time.sleep(2)
+            self._wait_visible(_AUTH_STATE_SELECTORS, timeout=5)
             
             # Check what type of login screen we're on
             if self._check_for_welcome_back_screen():
-                print("On welcome back screen - entering password only...")
+                logger.info("On welcome back screen - entering password only...")
                 return self._complete_password_login()
             else:
-                print("On fresh login screen - entering email and password...")
+                logger.info("On fresh login screen - entering email and password...")
                 return self._complete_fresh_login()
                 
         except Exception as e:
-            print(f"Error during fresh login: {e}")
+            logger.error("Error during fresh login: %s", e)
             return False
     
     def _complete_fresh_login(self) -> bool:
@@ -342,111 +720,92 @@ class LinkedInScraper(BaseScraper):
         Returns True if successful, False otherwise.
         """
         try:
-            # Find and fill email field
-            email_selectors = [
-                "input[name='session_key']",
-                "input[id='username']", 
-                "input[type='email']",
-                "input[autocomplete='username']"
-            ]
-            
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            email_field = element
-                            break
-                    if email_field:
-                        break
-                except Exception:
-                    continue
-            
-            if not email_field:
-                print("❌ Could not find email field")
-                return False
-            
-            print("Found email field. Entering email...")
-            email_field.clear()
-            email_field.send_keys(self.linkedin_email)
-            time.sleep(1)
-            
-            # Find and fill password field
-            password_selectors = [
-                "input[name='session_password']",
-                "input[id='password']",
-                "input[type='password']"
-            ]
-            
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            password_field = element
-                            break
-                    if password_field:
-                        break
-                except Exception:
-                    continue
-            
-            if not password_field:
-                print("❌ Could not find password field")
+            login_url = self.driver.current_url
+            if not self._submit_login_form(email=self.linkedin_email):
                 return False
             
-            print("Found password field. Entering password...")
-            password_field.clear()
-            password_field.send_keys(self.linkedin_password)
-            time.sleep(1)
-            
-            # Find and click sign in button
-            signin_selectors = [
-                "button[data-litms-control-urn='login-submit']",
-                "button[type='submit']",
-                ".login__form_action_container button",
-                "input[type='submit']",
-                "button:contains('Sign in')"
-            ]
-            
-            signin_button = None
-            for selector in signin_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            signin_button = element
-                            break
-                    if signin_button:
-                        break
-                except Exception:
-                    continue
-            
-            if not signin_button:
-                print("❌ Could not find sign in button")
-                return False
+            # Wait for LinkedIn to leave the login form instead of sleeping a fixed time
+            self._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=15, previous_url=login_url)
             
-            print("Found sign in button. Clicking to login...")
-            signin_button.click()
-            time.sleep(5)  # Wait longer for login processing
+            # The feed URL shows up before its navigation bar renders, and the login
+            # check below only trusts a visible nav
+            if not any(pattern in _url_path(self.driver.current_url) for pattern in _CHALLENGE_URL_PATTERNS):
+                self._wait_visible((_SEL_GLOBAL_NAV[1],), timeout=10)
             
             # Check if login was successful
             if self._is_logged_in():
-                print("✅ Fresh login successful!")
+                logger.info("✅ Fresh login successful!")
                 return True
             else:
-                current_url = self.driver.current_url
-                if "challenge" in current_url or "checkpoint" in current_url:
-                    print("⚠️ Login requires additional verification (CAPTCHA/2FA)")
+                path = _url_path(self.driver.current_url)
+                if any(pattern in path for pattern in _CHALLENGE_URL_PATTERNS):
+                    logger.warning("⚠️ Login requires additional verification (CAPTCHA/2FA)")
                     return False
                 else:
-                    print("❌ Fresh login failed - still not logged in")
+                    logger.error("❌ Fresh login failed - still not logged in")
                     return False
                     
         except Exception as e:
-            print(f"Error completing fresh login: {e}")
+            logger.error("Error completing fresh login: %s", e)
+            return False
+    
+    def _submit_login_form(self, email: str = None) -> bool:
+        """
+        Fill in the login form and click sign in. The email field is only filled when
+        an email is given (the "Welcome back" screen asks for the password alone).
+        Tries a single in-browser script first and falls back to typing into each
+        field through WebDriver. Returns True if the form was submitted.
+        """
+        try:
+            submitted = self.driver.execute_script(
+                _SUBMIT_LOGIN_JS, email, self.linkedin_password or "",
+                _EMAIL_FIELD_CSS, _PASSWORD_FIELD_CSS, _SIGNIN_BUTTON_CSS
+            )
+        except Exception as e:
+            logger.warning("Could not submit login form via script: %s", e)
+            submitted = False
+        if submitted:
+            logger.info("Filled in login form and clicked sign in.")
+            return True
+        
+        if email is not None:
+            email_field = self._find_visible_element(_EMAIL_FIELD_CSS)
+            if not email_field:
+                logger.error("❌ Could not find email field")
+                return False
+            
+            logger.info("Found email field. Entering email...")
+            email_field.clear()
+            email_field.send_keys(email)
+        
+        password_field = self._find_visible_element(_PASSWORD_FIELD_CSS)
+        if not password_field:
+            logger.error("❌ Could not find password field")
             return False
+        
+        logger.info("Found password field. Entering password...")
+        password_field.clear()
+        password_field.send_keys(self.linkedin_password)
+        
+        signin_button = self._find_visible_element(_SIGNIN_BUTTON_CSS, _SIGNIN_BUTTON_XPATH)
+        if not signin_button:
+            logger.error("❌ Could not find sign in button")
+            return False
+        
+        logger.info("Found sign in button. Clicking to login...")
+        signin_button.click()
+        return True
+    
+    def _find_visible_element(self, css_selector: str, xpath_fallback: str = None):
+        """
+        Find the first displayed element matching a (comma-separated) CSS selector,
+        falling back to an XPath query only if the CSS lookup finds nothing visible.
+        Matching and visibility checks run in one script call. Returns the element or None.
+        """
+        try:
+            return self.driver.execute_script(_FIND_VISIBLE_JS, css_selector, xpath_fallback)
+        except Exception:
+            return None
     
     def validate_url(self, url: str) -> bool:
         """
@@ -466,64 +825,53 @@ class LinkedInScraper(BaseScraper):
         Returns True if authentication appears successful, False otherwise.
         """
         try:
-            print("Loading cookies for authentication...")
-            
-            # Navigate to the signin page first - this is where authentication context is most appropriate
-            print("Navigating to LinkedIn signin page to inject cookies...")
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)  # Allow page to fully load
-            
-            # Apply stealth JavaScript on login page
-            self._reapply_stealth_javascript()
+            # Skip the login page and cookie injection entirely if the session is still valid
+            self.driver.get("https://www.linkedin.com/feed")
+            self._wait_visible(_AUTH_STATE_SELECTORS, timeout=5)
+            if self._is_logged_in():
+                logger.info("✅ Already logged in! Skipping cookie authentication.")
+                return True
             
-            with open(self.cookies_path, "r") as f:
-                cookies = json.load(f)
+            logger.info("Loading cookies for authentication...")
             
-            print(f"Loading {len(cookies)} cookies...")
-            for cookie in cookies:
-                # Sanitize the 'sameSite' attribute if it's invalid.
-                # Some browser extensions export this with values Selenium doesn't recognize.
-                if 'sameSite' in cookie and cookie['sameSite'] not in ["Strict", "Lax", "None"]:
-                    del cookie['sameSite']
-                self.driver.add_cookie(cookie)
+            cookies = self._load_cookie_file()
             
-            print("Successfully loaded session cookies.")
+            logger.info("Loading %d cookies...", len(cookies))
+            self._inject_cookies()
             
-            # After loading cookies, wait for page to refresh and show the "Welcome back" screen
-            print("Waiting for page to refresh to show Welcome back screen...")
-            time.sleep(2)  # Give time for cookies to process
+            logger.info("Successfully loaded session cookies.")
             
-            # Refresh the page to ensure cookies take effect
-            self.driver.refresh()
-            time.sleep(1)  # Wait for refresh to complete
+            # Open the feed with the new cookies; LinkedIn shows the "Welcome back" screen if it needs a password
+            logger.info("Opening feed to check for Welcome back screen...")
+            self.driver.get("https://www.linkedin.com/feed")
             
             # Wait for the Welcome back screen to appear
             welcome_back_detected = self._wait_for_welcome_back_screen(timeout=10)
             
             if welcome_back_detected:
-                print("Detected 'Welcome back' screen. Completing login with password...")
+                logger.info("Detected 'Welcome back' screen. Completing login with password...")
                 
                 if not self.linkedin_password:
-                    print("Error: LinkedIn password not provided in environment variables.")
+                    logger.error("LinkedIn password not provided in environment variables.")
                     return False
                 
                 # Complete the login by filling password and clicking sign in
                 login_success = self._complete_password_login()
                 if not login_success:
-                    print("Failed to complete password login.")
+                    logger.error("Failed to complete password login.")
                     return False
                 
-                print("Password login completed successfully! Authentication complete.")
+                logger.info("Password login completed successfully! Authentication complete.")
                 return True
             else:
-                print("No 'Welcome back' screen detected. May already be fully logged in.")
+                logger.info("No 'Welcome back' screen detected. May already be fully logged in.")
                 return True
                 
         except FileNotFoundError:
-            print(f"Cookie file not found at '{self.cookies_path}'. Cannot authenticate.")
+            logger.warning("Cookie file not found at '%s'. Cannot authenticate.", self.cookies_path)
             return False
         except Exception as e:
-            print(f"An error occurred during authentication: {e}")
+            logger.error("An error occurred during authentication: %s", e)
             return False
     
     def _check_for_welcome_back_screen(self) -> bool:
@@ -532,50 +880,23 @@ class LinkedInScraper(BaseScraper):
         Returns True ONLY if we're on the specific welcome back screen with the user's name.
         """
         try:
-            print("Checking for Welcome back screen...")
+            logger.info("Checking for Welcome back screen...")
+            state = self._get_auth_state()
             
-            # First, look for the specific "Welcome back" heading text
-            welcome_text_selectors = [
-                "//h1[contains(text(), 'Welcome back')]",
-                "//*[contains(text(), 'Welcome back')]"
-            ]
+            # Only the "Welcome back" text together with a password field counts
+            if not state["welcomeBack"]:
+                logger.info("No 'Welcome back' text found - not on welcome back screen")
+                return False
             
-            welcome_text_found = False
-            for selector in welcome_text_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    if elements and any(elem.is_displayed() for elem in elements):
-                        print(f"Welcome back text found using selector: {selector}")
-                        welcome_text_found = True
-                        break
-                except Exception:
-                    continue
+            if state["needsPassword"]:
+                logger.info("Welcome back screen confirmed - password field found")
+                return True
             
-            # Only if we found "Welcome back" text, then check for password field
-            if welcome_text_found:
-                password_selectors = [
-                    "input[name='session_password']",
-                    "input[type='password']",
-                    "#password"
-                ]
-                
-                for selector in password_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements and any(elem.is_displayed() for elem in elements):
-                            print(f"Welcome back screen confirmed - password field found: {selector}")
-                            return True
-                    except Exception:
-                        continue
-                
-                print("Welcome back text found but no password field - may already be logged in")
-                return False
-            else:
-                print("No 'Welcome back' text found - not on welcome back screen")
-                return False
+            logger.info("Welcome back text found but no password field - may already be logged in")
+            return False
                 
         except Exception as e:
-            print(f"Error checking for welcome back screen: {e}")
+            logger.error("Error checking for welcome back screen: %s", e)
             return False
     
     def _wait_for_welcome_back_screen(self, timeout: int = 15) -> bool:
@@ -583,15 +904,77 @@ class LinkedInScraper(BaseScraper):
         Wait for the Welcome back screen to appear after loading cookies.
         Returns True if welcome back screen appears, False if timeout.
         """
-        print(f"Waiting up to {timeout} seconds for Welcome back screen to appear...")
+        logger.info("Waiting up to %s seconds for Welcome back screen to appear...", timeout)
         
-        for attempt in range(timeout):
-            if self._check_for_welcome_back_screen():
-                return True
-            time.sleep(1)
+        # Let the driver poll for either outcome, then classify the page once
+        if not self._wait_for_welcome_back_or_nav(timeout=timeout):
+            logger.warning("Timeout waiting for Welcome back screen.")
+            return False
+        return self._check_for_welcome_back_screen()
+    
+    @cached_property
+    def wait(self) -> WebDriverWait:
+        """The default 10s wait, built on first use."""
+        return self._waiter(10)
+    
+    def _waiter(self, timeout: float) -> WebDriverWait:
+        """
+        Return the shared WebDriverWait for the given timeout, creating it on first use.
+        Elements re-rendered mid-poll raise StaleElementReferenceException, which just means
+        "not yet", so it's ignored like NoSuchElementException.
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                self.driver, timeout, poll_frequency=_POLL_FREQUENCY,
+                ignored_exceptions=(StaleElementReferenceException,)
+            )
+        return wait
+    
+    def _wait_visible(self, selectors, timeout: float = 10) -> bool:
+        """
+        Wait until any of the given CSS selectors matches a visible element.
+        Returns True as soon as one is visible, False on timeout.
+        """
+        conditions = [EC.visibility_of_element_located((By.CSS_SELECTOR, selector)) for selector in selectors]
+        try:
+            self._waiter(timeout).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_for_url(self, fragments, timeout: float = 10, previous_url: str = None) -> bool:
+        """
+        Wait until the current URL's path contains any of the given fragments and, when
+        previous_url is given, the URL has changed from it. Returns True as soon as it
+        does, False on timeout.
+        """
+        def arrived(d):
+            url = d.current_url
+            if url == previous_url:
+                return False
+            path = _url_path(url)
+            return any(fragment in path for fragment in fragments)
         
-        print("Timeout waiting for Welcome back screen.")
-        return False
+        try:
+            self._waiter(timeout).until(arrived)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_for_welcome_back_or_nav(self, timeout: float = 10) -> bool:
+        """
+        Wait until either the 'Welcome back' heading or the logged-in navigation bar is present.
+        Returns True as soon as one appears, False on timeout.
+        """
+        try:
+            self._waiter(timeout).until(EC.any_of(
+                EC.presence_of_element_located(_SEL_WELCOME_BACK),
+                EC.presence_of_element_located(_SEL_GLOBAL_NAV),
+            ))
+            return True
+        except TimeoutException:
+            return False
     
     def _complete_password_login(self) -> bool:
         """
@@ -599,305 +982,573 @@ class LinkedInScraper(BaseScraper):
         Returns True if login appears successful, False otherwise.
         """
         try:
-            # Find and fill the password field
-            password_selectors = [
-                "input[name='session_password']",
-                "input[type='password']",
-                "#password",
-                "input[id*='password']"
-            ]
-            
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            password_field = element
-                            break
-                    if password_field:
-                        break
-                except Exception:
-                    continue
+            # Wait for the password form to render before looking it up
+            self._wait_visible(("input[name='session_password']", "input[type='password']"), timeout=10)
             
-            if not password_field:
-                print("Could not find password field.")
+            login_url = self.driver.current_url
+            if not self._submit_login_form():
                 return False
             
-            print("Found password field. Filling in password...")
-            password_field.clear()
-            password_field.send_keys(self.linkedin_password)
-            time.sleep(1)
-            
-            # Find and click the sign in button
-            signin_selectors = [
-                "button[data-litms-control-urn='login-submit']",
-                "button[type='submit']",
-                "button:contains('Sign in')",
-                ".login__form_action_container button",
-                "input[type='submit']"
-            ]
-            
-            signin_button = None
-            for selector in signin_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            signin_button = element
-                            break
-                    if signin_button:
-                        break
-                except Exception:
-                    continue
-            
-            if not signin_button:
-                print("Could not find sign in button.")
-                return False
-            
-            print("Found sign in button. Clicking to complete login...")
-            signin_button.click()
-            time.sleep(3)  # Wait for LinkedIn to process login
+            # Wait for LinkedIn to process login and redirect away from the form
+            self._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=10, previous_url=login_url)
             
             # Check if login was successful by looking at the current URL and page content
             current_url = self.driver.current_url
-            print(f"Current URL after login attempt: {current_url}")
+            logger.info("Current URL after login attempt: %s", current_url)
+            path = _url_path(current_url)
             
             # Check for login success indicators
-            if "linkedin.com/feed" in current_url or "linkedin.com/in/" in current_url:
-                print("✅ Login successful - redirected to feed or profile!")
+            if path.startswith(_LOGGED_IN_PATH_PREFIXES):
+                logger.info("✅ Login successful - redirected to feed or profile!")
                 return True
-            elif "linkedin.com/login" in current_url or "linkedin.com/uas/login" in current_url:
-                print("❌ Login failed - still on login page")
+            elif path.startswith(_LOGIN_PATH_PREFIXES):
+                logger.error("❌ Login failed - still on login page")
                 return False
-            elif "challenge" in current_url or "checkpoint" in current_url:
-                print("⚠️  Login requires additional verification (CAPTCHA/email)")
+            elif any(pattern in path for pattern in _CHALLENGE_URL_PATTERNS):
+                logger.warning("⚠️  Login requires additional verification (CAPTCHA/email)")
                 return False
             else:
-                # Check page content for success/failure indicators
-                page_text = self.driver.page_source.lower()
-                if "welcome back" in page_text and "password" in page_text:
-                    print("❌ Still on welcome back screen - login may have failed")
+                # Only an unrecognised URL needs a look at the page itself
+                state = self._get_auth_state()
+                if state["welcomeBack"] and state["needsPassword"]:
+                    logger.error("❌ Still on welcome back screen - login may have failed")
                     return False
-                elif "feed" in page_text or "home" in page_text:
-                    print("✅ Login appears successful based on page content")
+                elif state["loggedIn"]:
+                    logger.info("✅ Login appears successful based on page content")
                     return True
                 else:
-                    print(f"⚠️  Uncertain login status. Current URL: {current_url}")
+                    logger.warning("⚠️  Uncertain login status. Current URL: %s", current_url)
                     return False
             
         except Exception as e:
-            print(f"Error completing password login: {e}")
+            logger.error("Error completing password login: %s", e)
             return False
 
-    def _load_cookies(self):
-        """Loads session cookies into the browser to maintain the user's session."""
+    def _load_cookie_file(self, refresh: bool = False) -> list:
+        """
+        Read and sanitize the cookies file once per scraper instance, converting the
+        cookies to CDP form at the same time so injection never has to redo it.
+        Subsequent calls return the cached list unless refresh=True.
+        Raises FileNotFoundError / json.JSONDecodeError like json.load would.
+        """
+        if self._cookies_cache is None or refresh:
+            with open(self.cookies_path, "rb") as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still apply
+            cookies = orjson.loads(raw) if orjson else json.loads(raw)
+            # Sanitize the 'sameSite' attribute if it's invalid.
+            # Some browser extensions export this with values Selenium doesn't recognize.
+            self._cookies_cache = [
+                {k: v for k, v in cookie.items() if k != 'sameSite' or v in _ALLOWED_SAMESITE}
+                for cookie in cookies
+            ]
+            self._cdp_cookies_cache = [_to_cdp_cookie(cookie) for cookie in self._cookies_cache]
+        return self._cookies_cache
+
+    def _inject_cookies(self):
+        """
+        Set all session cookies from the cookies file in the browser with a single CDP
+        Network.setCookies call, falling back to one add_cookie per cookie if CDP isn't available.
+        CDP doesn't need a LinkedIn page loaded; the fallback navigates to one only if necessary.
+        """
+        cookies = self._load_cookie_file()
         try:
-            # We must be on the linkedin.com domain to set cookies for it.
-            self.driver.get("https://www.linkedin.com")
-            with open(self.cookies_path, "r") as f:
-                cookies = json.load(f)
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": self._cdp_cookies_cache})
+        except Exception as e:
+            logger.warning("CDP cookie injection failed (%s); adding cookies one by one.", e)
+            # add_cookie only works for the domain of the page currently loaded
+            if "linkedin.com" not in self.driver.current_url:
+                self.driver.get("https://www.linkedin.com")
             for cookie in cookies:
-                # Sanitize the 'sameSite' attribute if it's invalid.
-                # Some browser extensions export this with values Selenium doesn't recognize.
-                if 'sameSite' in cookie and cookie['sameSite'] not in ["Strict", "Lax", "None"]:
-                    del cookie['sameSite']
                 self.driver.add_cookie(cookie)
-            print("Successfully loaded session cookies.")
+
+    def _load_cookies(self):
+        """Loads session cookies into the browser to maintain the user's session."""
+        try:
+            if self._is_session_probably_valid():
+                logger.info("Browser profile already has a LinkedIn session. Skipping cookie file.")
+                return
+            self._inject_cookies()
+            logger.info("Successfully loaded session cookies.")
         except FileNotFoundError:
-            print(f"Cookie file not found at '{self.cookies_path}'. Proceeding without authentication.")
+            logger.warning("Cookie file not found at '%s'. Proceeding without authentication.", self.cookies_path)
         except Exception as e:
-            print(f"An error occurred while loading cookies: {e}")
+            logger.error("An error occurred while loading cookies: %s", e)
 
-    def scrape(self, search_url: str) -> Iterator[Job]:
+    def scrape(self, search_url: str, fetch_descriptions: bool = True) -> Iterator[Job]:
         """
         Scrapes a LinkedIn job search URL by clicking each job and extracting details from the side panel.
 
         Args:
             search_url: The URL of the LinkedIn job search results page.
+            fetch_descriptions: If False, read title, company, location and URL from the
+                result list in one call and skip the detail panels; jobs then have an
+                empty description.
 
         Yields:
             A Job object for each successfully scraped job posting.
         """
-        # Perform proactive authentication before starting to scrape
-        print("🔐 Performing proactive authentication before scraping...")
-        auth_success = self.authenticate_proactively()
+        # Perform proactive authentication before starting to scrape, unless the session
+        # cookie says we're still logged in; the sign-in modal check below catches the rest
+        if self._is_session_probably_valid():
+            logger.info("🔐 LinkedIn session cookie present. Skipping proactive authentication.")
+            auth_success = True
+        else:
+            logger.info("🔐 Performing proactive authentication before scraping...")
+            auth_success = self.authenticate_proactively()
         if not auth_success:
-            print("❌ Proactive authentication failed. Cannot proceed with job scraping.")
+            logger.error("❌ Proactive authentication failed. Cannot proceed with job scraping.")
             self._send_auth_failure_notification("Proactive authentication failed")
             return
         
-        print(f"Navigating to search URL: {search_url}")
+        logger.info("Navigating to search URL: %s", search_url)
         self.driver.get(search_url)
         
-        # Apply JavaScript masking for this page
-        self._mask_automation_properties()
-        
         # Verify we're still authenticated after visiting the search URL
-        print("🔍 Verifying authentication after visiting search URL...")
-        time.sleep(2)  # Give page time to load
+        logger.info("🔍 Verifying authentication after visiting search URL...")
+        self._wait_visible(_SEARCH_PAGE_READY_SELECTORS, timeout=10)
         
         # Check for sign-in modal - if detected, try to authenticate again
         if self._check_for_signin_modal():
-            print("⚠️ Sign-in modal detected after visiting search URL. Attempting re-authentication...")
+            logger.warning("⚠️ Sign-in modal detected after visiting search URL. Attempting re-authentication...")
             
             # Try authentication one more time
             success = self._attempt_login()
             if not success:
-                print("❌ Re-authentication failed. Cannot proceed with job scraping.")
+                logger.error("❌ Re-authentication failed. Cannot proceed with job scraping.")
                 self._send_auth_failure_notification("Re-authentication after visiting search URL failed")
                 return
             
             # Navigate back to search URL after successful re-authentication
-            print("✅ Re-authentication successful. Returning to search page...")
+            logger.info("✅ Re-authentication successful. Returning to search page...")
             self.driver.get(search_url)
-            self._reapply_stealth_javascript()
             
             # Final check for sign-in modal
             if self._check_for_signin_modal():
-                print("❌ Still seeing sign-in modal after re-authentication. Login may have failed.")
+                logger.error("❌ Still seeing sign-in modal after re-authentication. Login may have failed.")
                 self._send_auth_failure_notification("Sign-in modal still present after re-authentication")
                 return
         else:
-            print("✅ No sign-in modal detected. Authentication verified.")
+            logger.info("✅ No sign-in modal detected. Authentication verified.")
+
+        # Force the virtualized result list to render every card up front
+        self._preload_job_list()
 
         # Use streamlined approach to get all jobs from the table directly
-        print("Looking for job elements using optimized path...")
+        logger.debug("Looking for job elements using optimized path...")
         
-        # Primary selector that we know works best
-        primary_selector = ".job-card-container"
-        
-        # Single fallback for when primary doesn't work
-        fallback_selector = ".artdeco-list li"
+        # Primary selector that we know works best, and a single fallback for when it doesn't
+        primary_selector = _SEL_JOB_CARDS[1]
+        fallback_selector = _SEL_JOB_CARDS_FALLBACK[1]
         
         working_selector = None
         all_job_elements = []
         
         # Try primary selector first
         try:
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, primary_selector)
+            job_elements = self.driver.find_elements(*_SEL_JOB_CARDS)
             
             if job_elements:
                 working_selector = primary_selector
                 all_job_elements = job_elements
-                print(f"✅ Found {len(job_elements)} jobs with primary selector: {primary_selector}")
+                logger.info("✅ Found %d jobs with primary selector: %s", len(job_elements), primary_selector)
             else:
-                print(f"Primary selector found no elements")
+                logger.debug("Primary selector found no elements")
         except Exception as e:
-            print(f"Primary selector failed: {e}")
+            logger.warning("Primary selector failed: %s", e)
         
         # Try fallback if primary didn't work
         if not working_selector:
             try:
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, fallback_selector)
+                job_elements = self.driver.find_elements(*_SEL_JOB_CARDS_FALLBACK)
                 
                 if job_elements:
                     working_selector = fallback_selector
                     all_job_elements = job_elements
-                    print(f"✅ Found {len(job_elements)} jobs with fallback selector: {fallback_selector}")
+                    logger.info("✅ Found %d jobs with fallback selector: %s", len(job_elements), fallback_selector)
                 else:
-                    print(f"Fallback selector found no elements")
+                    logger.debug("Fallback selector found no elements")
             except Exception as e:
-                print(f"Fallback selector failed: {e}")
+                logger.warning("Fallback selector failed: %s", e)
         
         if not working_selector or not all_job_elements:
-            print("❌ Could not find any job elements.")
+            logger.error("❌ Could not find any job elements.")
             return
             
-        print(f"Using working selector: {working_selector}")
-        print(f"Processing {len(all_job_elements)} jobs from the job table...")
+        logger.debug("Using working selector: %s", working_selector)
+        logger.info("Processing %d jobs from the job table...", len(all_job_elements))
         
+        # Read every card's job id in one call and leave out jobs scraped in earlier runs
+        try:
+            card_ids = self.driver.execute_script(_CARD_JOB_IDS_JS, working_selector)
+        except Exception as e:
+            logger.warning("Could not read job card ids: %s", e)
+            card_ids = [None] * len(all_job_elements)
+        pending = [index for index, job_id in enumerate(card_ids)
+                   if not (job_id and job_id.isdigit() and int(job_id) in self._known_ids)]
+        if len(pending) < len(card_ids):
+            logger.info("Skipping %d jobs already scraped in earlier runs.", len(card_ids) - len(pending))
+        
+        scrape_jobs = self._scrape_cards if fetch_descriptions else self._bulk_list_scrape
+        try:
+            yield from scrape_jobs(search_url, working_selector, pending, card_ids)
+        finally:
+            self._save_seen_job_ids()
+
+    def _scrape_cards(self, search_url: str, working_selector: str, pending: list[int],
+                      card_ids: list) -> Iterator[Job]:
+        """
+        Opens the result cards at the given indices and yields a Job for each new posting.
+        card_ids is the job id snapshot of the whole list, used to find each card again.
+        """
         # Process each job exactly once
-        processed_job_urls = set()  # Track processed jobs to avoid duplicates
+        processed_job_ids = set()  # Track processed jobs to avoid duplicates
         jobs_found_count = 0
+        total_jobs = len(pending)
+        reauthenticated = False
+        jobs_since_check = 0
+        batch_starts = list(range(0, total_jobs, _CARD_BATCH_SIZE))
         
-        for index in range(len(all_job_elements)):
-            try:
-                # Re-fetch the list on each iteration to avoid stale elements
-                fresh_job_list = self.driver.find_elements(By.CSS_SELECTOR, working_selector)
-                if index >= len(fresh_job_list):
-                    print(f"Job index {index} out of bounds, breaking loop.")
+        # Click through the cards in the browser a batch at a time, one round-trip per batch.
+        # A single browser thread runs the next batch while this one builds and yields the
+        # previous batch's jobs. Driver calls never overlap: the heartbeat and any re-auth
+        # happen between batches, while the browser thread is idle.
+        browser = ThreadPoolExecutor(max_workers=1)
+        
+        def start_batch(batch_start: int):
+            indices = pending[batch_start:batch_start + _CARD_BATCH_SIZE]
+            logger.debug("Processing jobs %d-%d/%d...", batch_start + 1, batch_start + len(indices), total_jobs)
+            return browser.submit(self._scrape_batch, working_selector, indices, [card_ids[i] for i in indices])
+        
+        try:
+            in_flight = start_batch(0) if batch_starts else None
+            for number, batch_start in enumerate(batch_starts):
+                indices = pending[batch_start:batch_start + _CARD_BATCH_SIZE]
+                try:
+                    batch = in_flight.result()
+                except InvalidSessionIdException:
+                    logger.error("Browser session became invalid. Ending scraping for this URL.")
+                    break
+                except TimeoutException:
+                    # Selenium raises TimeoutException when an async script overruns
+                    logger.warning("Jobs %d-%d took longer than the %ds script timeout. Skipping them.",
+                                   batch_start + 1, batch_start + len(indices), _SCRIPT_TIMEOUT)
+                    batch = None
+                except Exception as e:
+                    logger.warning("An error occurred while processing jobs %d-%d: %s",
+                                   batch_start + 1, batch_start + len(indices), e)
+                    batch = None
+                
+                if batch == []:
+                    logger.debug("Job index %d out of bounds, breaking loop.", indices[0])
                     break
                 
-                job_to_click = fresh_job_list[index]
+                # Queue the next batch before processing this one
+                in_flight = None
+                jobs_since_check += len(indices)
+                if number + 1 < len(batch_starts):
+                    # Cheap heartbeat so an expired session fails fast instead of timing out on every job
+                    check_session = jobs_since_check >= _SESSION_CHECK_INTERVAL
+                    if check_session:
+                        jobs_since_check = 0
+                    if check_session and not self._is_session_probably_valid():
+                        if reauthenticated or not self.authenticate_proactively():
+                            logger.error("❌ LinkedIn session expired mid-scrape and could not be restored.")
+                            self._send_auth_failure_notification("Session expired during job scraping")
+                        else:
+                            reauthenticated = True
+                            logger.info("✅ Session restored. Returning to search page...")
+                            self.driver.get(search_url)
+                            self._preload_job_list()
+                            in_flight = start_batch(batch_starts[number + 1])
+                    else:
+                        in_flight = start_batch(batch_starts[number + 1])
                 
-                # Scroll the job into view and click it to open detail panel
-                print(f"Processing job {index + 1}/{len(all_job_elements)}...")
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", job_to_click)
-                time.sleep(0.5)  # Brief pause for scrolling
-                job_to_click.click()
-                time.sleep(2)  # Wait for detail panel to load
-
-                # Scrape job details from the opened detail panel
-                job_details = self._get_job_details_from_panel(search_url)
-                if job_details and job_details.url not in processed_job_urls:
-                    processed_job_urls.add(job_details.url)
-                    jobs_found_count += 1
-                    yield job_details
-                elif job_details:
-                    print(f"Skipping duplicate job: {job_details.title}")
-
-            except ElementClickInterceptedException:
-                print(f"Could not click job at index {index}, it was obscured. Skipping.")
+                for index, details in zip(indices, batch or []):
+                    if details is None:
+                        logger.debug("Job card %d is no longer in the list. Skipping.", index)
+                        continue
+                    if details.get("error"):
+                        logger.warning("An error occurred while processing job index %d: %s", index, details["error"])
+                        continue
+                    job_details = self._job_from_panel_details(details, search_url)
+                    # Key on the LinkedIn job id so reordered/tracking query params don't defeat dedup
+                    job_key = None
+                    if job_details:
+                        match = _JOB_ID_RE.search(job_details.url)
+                        job_key = int(match.group(1)) if match else job_details.url
+                    if job_details and job_key not in processed_job_ids:
+                        processed_job_ids.add(job_key)
+                        if isinstance(job_key, int):
+                            self._known_ids.add(job_key)
+                            job_details.url = _JOB_VIEW_URL.format(job_key)
+                        jobs_found_count += 1
+                        yield job_details
+                    elif job_details:
+                        logger.debug("Skipping duplicate job: %s", job_details.title)
+                
+                if in_flight is None:
+                    break
+        finally:
+            browser.shutdown(wait=True)
+        
+        logger.info("Job processing complete. Found %d unique jobs total.", jobs_found_count)
+
+    def _scrape_batch(self, working_selector: str, indices: list[int], job_ids: list) -> list:
+        """
+        Reads the detail fields of one batch of result cards, aligned with indices.
+        Jobs the Voyager API returns are used as they are; only the rest are clicked open.
+        Entries are None for cards that couldn't be found; returns [] if none were.
+        """
+        results = self._fetch_jobs_via_voyager(job_ids)
+        missing = [k for k, details in enumerate(results) if details is None]
+        if missing:
+            clicked = self.driver.execute_async_script(
+                _SCRAPE_CARDS_JS, working_selector, [indices[k] for k in missing], [job_ids[k] for k in missing]
+            )
+            for k, details in zip(missing, clicked):
+                results[k] = details
+        return results if any(details is not None for details in results) else []
+
+    def _fetch_jobs_via_voyager(self, job_ids: list) -> list:
+        """
+        Fetches the given jobs from the Voyager API in one round-trip, in the shape the
+        detail panel scrape returns. Entries are None where the API gave nothing usable.
+        """
+        if not self._voyager_available or not any(job_ids):
+            return [None] * len(job_ids)
+        try:
+            fetched = self.driver.execute_async_script(_VOYAGER_JOBS_JS, job_ids)
+        except Exception as e:
+            logger.debug("Voyager job fetch failed: %s", e)
+            fetched = None
+        
+        requested = [job for job_id, job in zip(job_ids, fetched or []) if job_id]
+        if fetched is None or all(job and "failed" in job for job in requested):
+            # The API moved or refused us; don't pay for the extra call on every batch
+            logger.info("Voyager job API unavailable. Using the detail panel for the rest of this run.")
+            self._voyager_available = False
+            return [None] * len(job_ids)
+        
+        jobs = [job if job and "failed" not in job else None for job in fetched]
+        # Postings can lack a field pick() needs, so one batch with nothing usable is no
+        # reason to give up; several in a row means the response format has changed
+        self._voyager_empty_batches = 0 if any(jobs) else self._voyager_empty_batches + 1
+        if self._voyager_empty_batches >= _VOYAGER_MAX_EMPTY_BATCHES:
+            logger.info("Voyager job API returned nothing usable for %d batches. "
+                        "Using the detail panel for the rest of this run.", self._voyager_empty_batches)
+            self._voyager_available = False
+        return [
+            {
+                "title": job["title"],
+                "company": job["company"],
+                "tertiary": _voyager_tertiary(job),
+                # The API returns plain text; escape it so it's valid as the description HTML
+                "descriptionHtml": html.escape(job["description"]).replace("\n", "<br>"),
+                "url": _JOB_VIEW_URL.format(job_id),
+            } if job else None
+            for job_id, job in zip(job_ids, jobs)
+        ]
+
+    def _bulk_list_scrape(self, search_url: str, working_selector: str, pending: list[int],
+                          card_ids: list) -> Iterator[Job]:
+        """
+        Yields a Job for each new posting among the given result cards, read from the
+        result list in a single script call. The jobs carry no description, so their ids
+        are not recorded as seen; a later full scrape still opens them.
+        card_ids is unused: the whole list is read in place, so nothing needs finding again.
+        """
+        try:
+            cards = self.driver.execute_script(_LIST_CARDS_JS, working_selector, pending)
+        except Exception as e:
+            logger.warning("Could not read the job result list: %s", e)
+            return
+        
+        processed_job_ids = set()
+        jobs_found_count = 0
+        for card in cards:
+            if not card.get("title") or not card.get("url"):
+                logger.debug("Skipping job card without a title or link.")
                 continue
-            except InvalidSessionIdException:
-                print("Browser session became invalid. Ending scraping for this URL.")
-                break
-            except Exception as e:
-                print(f"An error occurred while processing job index {index}: {e}")
+            job_id = card.get("id")
+            job_key = int(job_id) if job_id and job_id.isdigit() else card["url"]
+            if job_key in processed_job_ids:
+                logger.debug("Skipping duplicate job: %s", card["title"])
                 continue
+            processed_job_ids.add(job_key)
+            jobs_found_count += 1
+            yield Job(
+                title=card["title"],
+                company=card.get("company") or "",
+                location=card.get("location") or "",
+                description="",
+                url=card["url"],
+                search_url=search_url,
+                platform="linkedin"
+            )
         
-        print(f"Job processing complete. Found {jobs_found_count} unique jobs total.")
+        logger.info("Job list read complete. Found %d unique jobs total.", jobs_found_count)
 
-    def _get_job_details_from_panel(self, search_url: str) -> Job | None:
+    @classmethod
+    def scrape_many(cls, urls: list[str], driver_factory: Callable[[], webdriver.Chrome],
+                    concurrency: int = 2, **scraper_kwargs) -> Iterator[Job]:
         """
-        Extracts all job details from the right-hand side panel.
+        Scrapes several search URLs in parallel, each worker driving its own browser.
+        A worker's scraper (and driver) is reused for every URL it picks up, so the
+        startup and login cost is paid once per worker rather than once per URL.
+
+        Args:
+            urls: LinkedIn job search URLs to scrape.
+            driver_factory: Callable returning a new WebDriver, called once per worker.
+            concurrency: Number of browsers to run at once. Keep this at 1-2 to stay
+                under LinkedIn's rate limits.
+            **scraper_kwargs: Passed to each LinkedInScraper (cookies_path, credentials, notifier).
+
+        Yields:
+            A Job object for each scraped posting, URL by URL as each one finishes.
         """
+        idle_scrapers = queue.SimpleQueue()
+        scrapers = []
+
+        def scrape_url(url: str) -> list[Job]:
+            # At most `concurrency` URLs run at once, so at most that many scrapers get built
+            try:
+                scraper = idle_scrapers.get_nowait()
+            except queue.Empty:
+                scraper = cls(driver_factory(), **scraper_kwargs)
+                scrapers.append(scraper)
+            try:
+                return list(scraper.scrape(url))
+            finally:
+                idle_scrapers.put(scraper)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
         try:
-            # Wait for the main panel container to ensure it's loaded
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-view-layout.jobs-details")))
-            
-            title = self.driver.find_element(By.CSS_SELECTOR, "div.job-details-jobs-unified-top-card__job-title h1").text.strip()
-            
-            company = self.driver.find_element(By.CSS_SELECTOR, "div.job-details-jobs-unified-top-card__company-name a").text.strip()
-            
-            # The location is the first part of a container with other info
-            tertiary_info = self.driver.find_element(By.CSS_SELECTOR, "div.job-details-jobs-unified-top-card__tertiary-description-container").text.strip()
-            location = tertiary_info.split('·')[0].strip()
+            futures = {executor.submit(scrape_url, url): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    logger.error("Failed to scrape %s: %s", futures[future], e)
+                    continue
+                logger.info("Found %d jobs from %s", len(jobs), futures[future])
+                yield from jobs
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for scraper in scrapers:
+                try:
+                    scraper.driver.quit()
+                except Exception as e:
+                    logger.warning("Could not close a worker browser: %s", e)
+
+    def _load_seen_job_ids(self) -> set[int]:
+        """
+        Load the ids of jobs scraped in earlier runs from the seen jobs file.
+        Returns an empty set if the file is missing or unreadable.
+        """
+        if not self.seen_jobs_path:
+            return set()
+        try:
+            with open(self.seen_jobs_path, "rb") as f:
+                raw = f.read()
+            return set(orjson.loads(raw) if orjson else json.loads(raw))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning("Could not read seen jobs file '%s': %s", self.seen_jobs_path, e)
+            return set()
 
-            # Expand the job description
+    def _save_seen_job_ids(self):
+        """
+        Write the known job ids back to the seen jobs file, merged with whatever
+        other scrapers have saved since this one loaded it.
+        """
+        if not self.seen_jobs_path:
+            return
+        with _SEEN_JOBS_LOCK:
+            self._known_ids |= self._load_seen_job_ids()
+            # Write a temp file next to the real one and swap it in, so a run that dies
+            # mid-write can't leave a truncated file and lose the whole history
+            tmp_path = None
             try:
-                see_more_button = self.driver.find_element(By.CSS_SELECTOR, "button.jobs-description__footer-button")
-                self.driver.execute_script("arguments[0].click();", see_more_button)
-                time.sleep(0.5) # A minimal pause for content to reflow
-            except NoSuchElementException:
-                pass # No "see more" button
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(os.path.abspath(self.seen_jobs_path)), suffix=".tmp"
+                )
+                with os.fdopen(fd, "w") as f:
+                    json.dump(sorted(self._known_ids), f)
+                os.replace(tmp_path, self.seen_jobs_path)
+            except OSError as e:
+                logger.warning("Could not write seen jobs file '%s': %s", self.seen_jobs_path, e)
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
-            description_container = self.driver.find_element(By.CSS_SELECTOR, "div#job-details")
-            description_html = description_container.get_attribute('innerHTML').strip()
-            description_text = description_container.text.strip()
-            
-            current_url = self.driver.current_url
-            
-            print(f"✅ Scraped: {title} at {company}")
-            
-            return Job(
-                title=title,
-                company=company,
-                location=location,
-                description=description_html,
-                url=current_url,
-                search_url=search_url,
-                platform="linkedin"
-            )
-        except TimeoutException:
-            print("Timed out waiting for job details panel to load.")
-            return None
-        except NoSuchElementException as e:
-            print(f"Could not find an element in the details panel: {e}")
+    def _is_session_probably_valid(self) -> bool:
+        """
+        Check whether the browser holds an unexpired LinkedIn session cookie (li_at),
+        without navigating or touching the page DOM. It can't tell whether LinkedIn has
+        revoked the session server-side, so callers keep a real check as the fallback.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": ["https://www.linkedin.com"]})
+            # CDP reports session cookies with expires == -1
+            expiries = [cookie.get("expires", -1) for cookie in result.get("cookies", [])
+                        if cookie.get("name") == "li_at"]
+        except Exception:
+            cookie = self.driver.get_cookie("li_at")
+            expiries = [cookie.get("expiry", -1)] if cookie else []
+        now = time.time()
+        return any(expiry is None or expiry < 0 or expiry > now for expiry in expiries)
+
+    def _preload_job_list(self):
+        """
+        Scroll the job results list to the bottom once so LinkedIn's lazy loading
+        renders every job card before the scrape loop starts.
+        """
+        try:
+            self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                const scroller = document.querySelector('.jobs-search-results-list');
+                if (!scroller) { done(false); return; }
+                let prev = -1;
+                let steps = 0;
+                (async function loadAll() {
+                    while (scroller.scrollTop !== prev && steps < 50) {
+                        prev = scroller.scrollTop;
+                        scroller.scrollBy(0, 800);
+                        steps++;
+                        await new Promise(r => setTimeout(r, 150));
+                    }
+                    scroller.scrollTop = 0;
+                    done(true);
+                })();
+            """)
+        except Exception as e:
+            logger.warning("Could not pre-scroll job list: %s", e)
+
+    def _job_from_panel_details(self, details: dict, search_url: str) -> Job | None:
+        """
+        Builds a Job from the detail panel fields read by _SCRAPE_CARDS_JS.
+        Returns None if a required field is missing.
+        """
+        missing = [key for key in ("title", "company", "tertiary", "descriptionHtml") if details.get(key) is None]
+        if missing:
+            logger.warning("Could not find %s in the details panel", ", ".join(missing))
             return None
+        
+        raw = RawJob(
+            title=details["title"],
+            company=details["company"],
+            tertiary=details["tertiary"],
+            description_html=details["descriptionHtml"],
+            url=details["url"],
+            search_url=search_url,
+        )
+        try:
+            job = finalize_job(raw)
+            logger.debug("✅ Scraped: %s at %s", job.title, job.company)
+            return job
         except Exception as e:
-            print(f"An unexpected error occurred while scraping details panel: {e}")
+            logger.warning("An unexpected error occurred while scraping details panel: %s", e)
             return None
 
     def _check_for_signin_modal(self):
@@ -905,36 +1556,14 @@ class LinkedInScraper(BaseScraper):
         Checks if the 'Sign in to view more jobs' modal is present on the page.
         Returns True if modal is detected, False otherwise.
         """
-        signin_modal_selectors = [
-            # Text-based detection
-            "//*[contains(text(), 'Sign in to view more jobs')]",
-            "//*[contains(text(), 'Continue with Google')]", 
-            "//*[contains(text(), 'Sign In') and contains(@class, 'button')]",
-            # Modal container detection
-            ".auth-modal",
-            ".contextual-sign-in-modal",
-            "[data-tracking-control-name*='sign-in-modal']",
-            # Button detection
-            "button[data-tracking-control-name*='contextual-sign-in']",
-            # Generic modal patterns
-            "[role='dialog'][aria-labelledby*='sign']"
-        ]
-        
-        for selector in signin_modal_selectors:
-            try:
-                if selector.startswith("//"):
-                    # XPath selector
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    # CSS selector
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements and any(elem.is_displayed() for elem in elements):
-                    print(f"Sign-in modal detected using selector: {selector}")
-                    return True
-            except Exception:
-                continue
-        
+        # Query and visibility-test every marker in the browser: one round-trip, no is_displayed() calls
+        try:
+            selector = self.driver.execute_script(_SIGNIN_MODAL_JS, _SIGNIN_MODAL_CSS, _SIGNIN_MODAL_XPATH)
+        except Exception:
+            return False
+        if selector:
+            logger.info("Sign-in modal detected using selector: %s", selector)
+            return True
         return False
     
     def _send_auth_failure_notification(self, failure_reason: str):
@@ -948,15 +1577,15 @@ class LinkedInScraper(BaseScraper):
                 message += f"1. Log into LinkedIn manually in your browser\n"
                 message += f"2. Export fresh cookies using the browser extension\n"
                 message += f"3. Replace the cookies.json file in the repository\n\n"
-                message += f"**Time:** {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}"
+                message += f"**Time:** {time.strftime(_TS_FMT, time.gmtime())}"
                 
-                print("Sending authentication failure notification via Telegram...")
+                logger.info("Sending authentication failure notification via Telegram...")
                 self.notifier.send_message(message)
-                print("✅ Telegram notification sent successfully")
+                logger.info("✅ Telegram notification sent successfully")
             except Exception as e:
-                print(f"❌ Failed to send Telegram notification: {e}")
+                logger.error("❌ Failed to send Telegram notification: %s", e)
         else:
-            print("⚠️ No notifier configured - cannot send authentication failure alert")
+            logger.warning("⚠️ No notifier configured - cannot send authentication failure alert")
 
 
 if __name__ == '__main__':
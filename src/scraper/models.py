@@ -1,8 +1,24 @@
+import inspect
+import time
+from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-@dataclass
+try:
+    import zstandard  # Optional: keeps large description HTML compressed in memory
+except ImportError:
+    zstandard = None
+
+# Descriptions shorter than this (in bytes) are kept as plain text; they barely compress
+_COMPRESS_MIN_BYTES = 2048
+_ZSTD_LEVEL = 3
+
+# Job fields exactly as read from a listing page, before any parsing
+RawJob = namedtuple('RawJob', 'title company tertiary description_html url search_url')
+
+
+@dataclass(slots=True)
 class Job:
     """
     A data class to hold structured information about a job posting.
@@ -12,13 +28,13 @@ class Job:
     title: str
     company: str
     location: str
-    description: str
+    description: str  # Stored compressed when large; see the description property below
     url: str
     
     # Metadata fields
     platform: str = ""  # Platform where the job was found (linkedin, indeed, etc.)
     search_url: str = ""  # Original search URL that led to this job
-    scraped_at: datetime = field(default_factory=datetime.now)
+    scraped_at_ns: int = field(default_factory=time.time_ns)  # Epoch nanoseconds; see scraped_at
     
     # Optional fields that may not be available on all platforms
     salary_range: Optional[str] = None
@@ -32,6 +48,11 @@ class Job:
     # Platform-specific additional data
     platform_data: Dict[str, Any] = field(default_factory=dict)
     
+    @property
+    def scraped_at(self) -> datetime:
+        """Local time the job was scraped, built from scraped_at_ns on demand."""
+        return datetime.fromtimestamp(self.scraped_at_ns / 1e9)
+    
     def get_platform_field(self, field_name: str, default: Any = None) -> Any:
         """
         Get a platform-specific field value.
@@ -62,21 +83,37 @@ class Job:
         Returns:
             Dictionary representation of the job
         """
-        return {
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'description': self.description,
-            'url': self.url,
-            'platform': self.platform,
-            'search_url': self.search_url,
-            'scraped_at': self.scraped_at.isoformat(),
-            'salary_range': self.salary_range,
-            'job_type': self.job_type,
-            'experience_level': self.experience_level,
-            'company_size': self.company_size,
-            'industry': self.industry,
-            'remote_option': self.remote_option,
-            'posted_date': self.posted_date,
-            'platform_data': self.platform_data
-        }
\ No newline at end of file
+        data = {name: getattr(self, name) for name in _JOB_FIELD_NAMES}
+        data['scraped_at'] = self.scraped_at.isoformat()
+        return data
+
+
+# The slot generated for the description field. It holds zstd-compressed bytes for
+# large text, else the str itself; the description property below reads and writes it.
+_description_slot = Job.description
+
+
+def _get_description(job: Job) -> str:
+    blob = _description_slot.__get__(job, Job)
+    return blob if isinstance(blob, str) else zstandard.decompress(blob).decode()
+
+
+def _set_description(job: Job, text: str) -> None:
+    data = text.encode()
+    if zstandard is not None and len(data) >= _COMPRESS_MIN_BYTES:
+        # Module-level compress() rather than a shared ZstdCompressor, which isn't
+        # safe to use from several scraper threads at once
+        _description_slot.__set__(job, zstandard.compress(data, _ZSTD_LEVEL))
+    else:
+        _description_slot.__set__(job, text)
+
+
+# Replaces the slot on the class so __init__, replace(), asdict() and pickling all go
+# through the property and only ever see the plain text
+Job.description = property(_get_description, _set_description, doc="The job description (HTML).")
+
+# Keys of Job.to_dict(), in constructor argument order; the raw scraped_at_ns is
+# serialized as scraped_at
+_JOB_FIELD_NAMES = tuple(
+    'scraped_at' if name == 'scraped_at_ns' else name for name in inspect.signature(Job).parameters
+)
\ No newline at end of file
@@ -1,6 +1,88 @@
 import sys
 import os
+import socket
+import time
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 # Add the src directory to the Python path so that tests can import the application modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))) 
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+
+def _network_disabled(*args, **kwargs):
+    raise RuntimeError("network access is disabled in tests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_network():
+    """
+    Fails any outbound connection immediately, so a code path that slips past the
+    mocks raises instead of stalling on a DNS lookup or TCP timeout.
+    Session-scoped so it is already in place for module-scoped pipeline runs.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(socket.socket, "connect", _network_disabled)
+        monkeypatch.setattr(socket.socket, "connect_ex", _network_disabled)
+        monkeypatch.setattr(socket, "getaddrinfo", _network_disabled)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_sleep():
+    """
+    Turns time.sleep into a no-op. main() and the scraper pause between URLs, messages
+    and retries, which only slows tests down when everything behind them is mocked.
+    Session-scoped so it is already in place for module-scoped pipeline runs.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(time, "sleep", lambda *args: None)
+        yield
+
+
+class FakeOpenAI:
+    """
+    Stands in for openai.OpenAI. Every client the agents construct shares the same
+    chat.completions.create mock, so tests script responses in one place.
+    """
+    chat = SimpleNamespace(completions=SimpleNamespace(create=MagicMock()))
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def _resp(text):
+    """Builds a minimal stand-in for an OpenAI chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_openai():
+    """Installs FakeOpenAI once for the whole session."""
+    # The agents bind OpenAI at import time, so their module attributes are patched
+    # as well as the openai package itself
+    from agents import generation_agent, review_agent, validation_agent
+
+    with ExitStack() as stack:
+        stack.enter_context(patch('openai.OpenAI', new=FakeOpenAI))
+        for module in (validation_agent, generation_agent, review_agent):
+            stack.enter_context(patch.object(module, 'OpenAI', new=FakeOpenAI))
+        yield FakeOpenAI
+
+
+@pytest.fixture(scope="session")
+def openai_responses():
+    """
+    Returns a function that resets the shared chat.completions.create mock, queues
+    completion texts on it in call order, and returns the mock.
+    """
+    create = FakeOpenAI.chat.completions.create
+
+    def queue_responses(*texts):
+        create.reset_mock(return_value=True, side_effect=True)
+        create.side_effect = [_resp(text) for text in texts]
+        return create
+
+    return queue_responses
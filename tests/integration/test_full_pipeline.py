@@ -1,110 +1,149 @@
 import os
 import json
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 from src.scraper.models import Job
-from src.main import main
-from src.config.config import Config
 # We no longer need to import the real scraper
 # from src.scraper.linkedin_scraper import LinkedInScraper 
 
-@pytest.fixture
-def test_config(tmp_path, monkeypatch):
+pytestmark = pytest.mark.integration
+
+# Contents served by Config's file loaders, keyed by the name it asks for
+_CONFIG_FILES = {
+    "search_urls.txt": "https://www.linkedin.com/jobs/search/?keywords=product%20manager",
+    "resume.json": json.dumps({"experience": "Product Manager"}),
+}
+_WRITING_SAMPLES = {"sample1.txt": "This is my writing style."}
+
+# Jobs returned by the mocked scraper: the first is a fit, the second is not
+_MOCK_JOBS = (
+    Job(title="Associate Product Manager", company="Company A", url="http://example.com/1", description="Desc 1", location="Remote", platform="linkedin"),
+    Job(title="Product Manager", company="Company B", url="http://example.com/2", description="Desc 2", location="New York, NY", platform="linkedin"),
+)
+
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory):
     """
     Creates a temporary configuration for testing purposes.
+    Built once per session. Config's loaders are patched to serve files from memory.
     """
-    # Create dummy config files with valid LinkedIn URL
-    (tmp_path / "search_urls.txt").write_text("https://www.linkedin.com/jobs/search/?keywords=product%20manager")
-    (tmp_path / "cookies.json").write_text(json.dumps([{"name": "li_at", "value": "dummy"}]))
-    (tmp_path / "resume.json").write_text(json.dumps({"experience": "Product Manager"}))
+    # The config module exactly as src.main imports it (src/ is on sys.path), so patches
+    # on its Config class reach main()
+    from config import config as app_config
+
+    tmp_path = tmp_path_factory.mktemp("pipeline_cfg")
+
+    # The agents open the ideal job profile by path, so it is the one file kept on disk
     (tmp_path / "ideal_job_profile.txt").write_text("An ideal job.")
-    (tmp_path / "writing_style_samples").mkdir()
-    (tmp_path / "writing_style_samples/sample1.txt").write_text("This is my writing style.")
 
-    # Mock environment variables
-    monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_bot_token")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "12345")
+    # The function-scoped monkeypatch fixture can't be used here, so undo on session teardown
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Serve the remaining config files from memory, and drop any cached singleton
+        # so the patched loaders are the ones that run
+        monkeypatch.setattr(app_config.Config, "_instance", None)
+        monkeypatch.setattr(app_config.Config, "_load_file", lambda self, filename: _CONFIG_FILES.get(filename, ""))
+        monkeypatch.setattr(app_config.Config, "_load_json_file", lambda self, filename: {})
+        monkeypatch.setattr(app_config.Config, "_load_writing_samples", lambda self, dirname: dict(_WRITING_SAMPLES))
 
-    # The Config class reads from the CWD, so we change it for the test.
-    monkeypatch.chdir(tmp_path)
+        # Mock environment variables
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        # The generation agent skips its model call without a key
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test_openrouter_key")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_bot_token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "12345")
 
-    # Since main() creates its own Config instance, we don't need to return one.
-    # We just need the environment to be set up correctly.
+        # The workflow reads the job profile and writes its sent jobs log in the CWD.
+        monkeypatch.chdir(tmp_path)
 
-def test_full_pipeline_with_mocks(test_config):
+        # Since main() creates its own Config instance, we don't need to return one.
+        # We just need the environment to be set up correctly.
+        yield
+
+# Completion text returned by the generation agent's model
+_GENERATED = "Resume points---SPLIT---Cover letter"
+# Review agent verdicts, in the decision---SPLIT---reason format it asks the model for
+_REVIEW_OK = "YES---SPLIT---Tailored to the role."
+_REVIEW_REJECTED = "NO---SPLIT---Too generic."
+
+# Each case lists the model responses in call order, and whether a job alert is expected.
+# Jobs run through the workflow one at a time: validation, then generation and review
+# for an approved job.
+_CASES = [
+    pytest.param((["YES", _GENERATED, _REVIEW_OK, "NO"], True), id="first-approved"),
+    pytest.param((["NO", "NO"], False), id="none-approved"),
+    pytest.param((["YES", _GENERATED, _REVIEW_REJECTED, _GENERATED, _REVIEW_OK, "NO"], True), id="approved-on-retry"),
+]
+
+@pytest.fixture(scope="module", params=_CASES)
+def pipeline_run(request, test_config, openai_responses):
     """
-    Tests the full pipeline from the main() entrypoint with mocked external services.
+    Runs the full pipeline from the main() entrypoint once per case, with mocked external
+    services, and returns the mocks for the tests below to inspect.
     - Mocks the LinkedInScraper to avoid network calls.
     - Mocks the generative AI models to avoid API calls and control output.
     - Mocks the TelegramNotifier to prevent sending actual messages.
     """
-    # 1. Define mock data and return values
-    mock_job_1 = Job(title="Associate Product Manager", company="Company A", url="http://example.com/1", description="Desc 1", location="Remote", platform="linkedin")
-    mock_job_2 = Job(title="Product Manager", company="Company B", url="http://example.com/2", description="Desc 2", location="New York, NY", platform="linkedin")
-    mock_jobs = [mock_job_1, mock_job_2]
-
-    # 2. Set up patches for all external services
-    with patch('src.main.setup_chrome_driver') as MockDriverSetup, \
-         patch('src.main.ScraperFactory.create_scraper') as MockScraperFactory, \
-         patch('openai.OpenAI') as MockOpenAIClient, \
-         patch('src.main.TelegramNotifier') as MockNotifier:
-
-        # Configure the return values for each mock
-        mock_driver = MagicMock()
-        MockDriverSetup.return_value = mock_driver
-        
-        mock_scraper_instance = MagicMock()
-        mock_scraper_instance.scrape.return_value = mock_jobs
-        mock_scraper_instance.validate_url.return_value = True  # Always validate URLs
+    # Imported here rather than at module top so collecting this file doesn't pull in
+    # Selenium, the OpenAI SDK and the Telegram client
+    from src import main as main_module
+
+    verdicts, expect_notify = request.param
+
+    # 1. Set up patches for all external services
+    with patch.multiple(main_module, setup_chrome_driver=DEFAULT, TelegramNotifier=DEFAULT) as main_mocks, \
+         patch.object(main_module.ScraperFactory, 'create_scraper') as MockScraperFactory:
+        MockDriverSetup = main_mocks['setup_chrome_driver']
+        MockNotifier = main_mocks['TelegramNotifier']
+
+        # Configure the return values for each mock. The driver is only handed to the
+        # (mocked) scraper factory and quit at the end, so a bare stub is enough.
+        MockDriverSetup.return_value = SimpleNamespace(quit=lambda: None)
+
+        mock_scraper_instance = SimpleNamespace(
+            authenticate_proactively=lambda: True,
+            validate_url=lambda url: True,  # Always validate URLs
+            scrape=MagicMock(return_value=list(_MOCK_JOBS)),
+        )
         MockScraperFactory.return_value = mock_scraper_instance
-        
-        # Mock OpenAI client for all agents (validation, generation, review)
-        mock_openai_client = MockOpenAIClient.return_value
-        
-        # Set up responses for different API calls
-        # 1st call: Validation for first job (YES)
-        # 2nd call: Validation for second job (NO) 
-        # 3rd call: Generation for approved job
-        # 4th call: Review for generated content
-        mock_response_1 = MagicMock()
-        mock_response_1.choices[0].message.content = "YES"
-        
-        mock_response_2 = MagicMock()
-        mock_response_2.choices[0].message.content = "NO"
-        
-        mock_response_3 = MagicMock()
-        mock_response_3.choices[0].message.content = "Resume points---SPLIT---Cover letter"
-        
-        mock_response_4 = MagicMock()
-        mock_response_4.choices[0].message.content = "YES"
-        
-        mock_openai_client.chat.completions.create.side_effect = [
-            mock_response_1,  # First job validation: YES
-            mock_response_2,  # Second job validation: NO
-            mock_response_3,  # Content generation for first job
-            mock_response_4   # Content review: YES
-        ]
-
-        # Get a reference to the notifier instance for assertion
-        notifier_instance = MockNotifier.return_value
-
-        # 3. Run the main function
-        main()
-
-        # 4. Assert that the external services were called correctly
-        mock_scraper_instance.scrape.assert_called()
-        
-        # OpenAI client should be called 4 times:
-        # 2 for validation (both jobs), 1 for generation, 1 for review
-        assert mock_openai_client.chat.completions.create.call_count == 4
-
-        # Notifier should only be called once with the final message for the approved job
-        notifier_instance.send_message.assert_called_once()
-        
-        # Optional: Check the content of the message sent
-        sent_message = notifier_instance.send_message.call_args[0][0]
-        assert "Associate Product Manager" in sent_message
-        # The second job should be rejected so it shouldn't appear in the final message
-        assert "Company B" not in sent_message 
\ No newline at end of file
+
+        # Set up responses for the shared OpenAI client mock, in call order
+        create_completion = openai_responses(*verdicts)
+
+        # 2. Run the main function
+        main_module.main()
+
+    # Snapshot the recorded calls once; the completion mock is also shared by every case
+    yield {
+        "verdicts": verdicts,
+        "expect_notify": expect_notify,
+        "scrape_calls": mock_scraper_instance.scrape.call_args_list,
+        "openai_calls": list(create_completion.call_args_list),
+        "notify_calls": MockNotifier.return_value.send_message.call_args_list,
+    }
+
+    # Workflow marks sent jobs in the shared config dir; clear it for the next case
+    if os.path.exists("sent_jobs.log"):
+        os.remove("sent_jobs.log")
+
+def test_scraper_called(pipeline_run):
+    assert len(pipeline_run["scrape_calls"]) >= 1
+
+def test_every_response_consumed(pipeline_run):
+    assert len(pipeline_run["openai_calls"]) == len(pipeline_run["verdicts"])
+
+def test_notifies_only_approved_job(pipeline_run):
+    notify_calls = pipeline_run["notify_calls"]
+    if not pipeline_run["expect_notify"]:
+        assert notify_calls == []
+        return
+
+    # The approved job is sent as three messages: the alert, resume suggestions and cover letter
+    assert len(notify_calls) == 3
+    sent_messages = [call.args[0] for call in notify_calls]
+    assert "Associate Product Manager" in sent_messages[0]
+    assert "Resume points" in sent_messages[1]
+    assert "Cover letter" in sent_messages[2]
+    # The second job should be rejected so it shouldn't appear in any message
+    assert not any("Company B" in message for message in sent_messages)
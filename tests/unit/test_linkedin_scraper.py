@@ -0,0 +1,526 @@
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.scraper import linkedin_scraper
+from src.scraper.linkedin_scraper import (
+    LinkedInScraper, _CARD_BATCH_SIZE, _CARD_SCRAPE_MAX_SECONDS, _POST_LOGIN_URL_PATTERNS, _SCRIPT_TIMEOUT,
+    _TERTIARY_RE, _VOYAGER_MAX_EMPTY_BATCHES, _posted_ago, _to_cdp_cookie, _url_path, _voyager_tertiary,
+    finalize_job,
+)
+from src.scraper.models import Job, RawJob
+
+_LOGIN_URL = "https://www.linkedin.com/login?session_redirect=https%3A%2F%2Fwww.linkedin.com%2Ffeed%2F"
+
+
+class _UrlSequenceDriver:
+    """Driver stub whose current_url steps through the given URLs, then stays on the last."""
+
+    def __init__(self, *urls):
+        self._urls = list(urls)
+
+    @property
+    def current_url(self):
+        return self._urls.pop(0) if len(self._urls) > 1 else self._urls[0]
+
+
+@pytest.fixture
+def scraper():
+    return LinkedInScraper(None)
+
+
+def test_url_path_ignores_query_string():
+    assert _url_path(_LOGIN_URL) == "/login"
+    assert _url_path("https://www.linkedin.com/Feed/?trk=x") == "/feed/"
+
+
+def test_wait_for_url_ignores_feed_in_redirect_param(scraper):
+    scraper.driver = _UrlSequenceDriver(_LOGIN_URL)
+    assert not scraper._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=0.2)
+
+
+def test_wait_for_url_waits_for_url_to_change(scraper):
+    scraper.driver = _UrlSequenceDriver(_LOGIN_URL, _LOGIN_URL, "https://www.linkedin.com/feed/")
+    assert scraper._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=1, previous_url=_LOGIN_URL)
+
+
+def test_wait_for_url_unchanged_challenge_url_times_out(scraper):
+    challenge_url = "https://www.linkedin.com/checkpoint/challenge/abc"
+    scraper.driver = _UrlSequenceDriver(challenge_url)
+    assert not scraper._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=0.2, previous_url=challenge_url)
+    assert scraper._wait_for_url(_POST_LOGIN_URL_PATTERNS, timeout=0.2)
+
+
+def test_list_only_scrape_does_not_mark_jobs_seen(scraper):
+    cards = [
+        {"id": "101", "title": "Associate Product Manager", "company": "Company A",
+         "location": "Remote", "url": "https://www.linkedin.com/jobs/view/101/"},
+        {"id": "101", "title": "Associate Product Manager", "company": "Company A",
+         "location": "Remote", "url": "https://www.linkedin.com/jobs/view/101/"},
+    ]
+    scraper.driver = SimpleNamespace(execute_script=lambda *args: cards)
+
+    jobs = list(scraper._bulk_list_scrape("https://www.linkedin.com/jobs/search/", ".card", [0, 1], []))
+
+    assert [job.title for job in jobs] == ["Associate Product Manager"]
+    assert jobs[0].description == ""
+    assert scraper._known_ids == set()
+
+
+def _raw_job(tertiary="San Francisco, CA · 2 weeks ago · 100 applicants",
+             description_html="<p>Own the <b>roadmap</b>.</p><ul><li>Ship</li></ul>"):
+    return RawJob(title="Associate Product Manager", company="Company A", tertiary=tertiary,
+                  description_html=description_html, url="https://www.linkedin.com/jobs/view/101/",
+                  search_url="https://www.linkedin.com/jobs/search/")
+
+
+def test_finalize_job_builds_job_from_panel_fields():
+    job = finalize_job(_raw_job())
+
+    assert (job.title, job.company, job.location) == ("Associate Product Manager", "Company A", "San Francisco, CA")
+    assert job.posted_date == "2 weeks ago"
+    assert job.get_platform_field("applicants_raw") == "100 applicants"
+    assert job.description == "<p>Own the <b>roadmap</b>.</p><ul><li>Ship</li></ul>"
+    assert (job.platform, job.search_url) == ("linkedin", "https://www.linkedin.com/jobs/search/")
+
+
+def test_finalize_job_with_empty_tertiary_line():
+    job = finalize_job(_raw_job(tertiary=""))
+
+    assert job.location == ""
+    assert job.posted_date is None
+    assert job.get_platform_field("applicants_raw") is None
+
+
+def test_to_cdp_cookie_keeps_cdp_keys_and_maps_expiry():
+    cookie = {"name": "li_at", "value": "abc", "domain": ".linkedin.com", "path": "/",
+              "secure": True, "httpOnly": True, "sameSite": "None", "expiry": 1900000000,
+              "hostOnly": False, "storeId": "0"}
+
+    assert _to_cdp_cookie(cookie) == {
+        "name": "li_at", "value": "abc", "domain": ".linkedin.com", "path": "/",
+        "secure": True, "httpOnly": True, "sameSite": "None", "expires": 1900000000,
+    }
+
+
+def test_to_cdp_cookie_drops_invalid_samesite():
+    cookie = {"name": "li_at", "value": "abc", "domain": ".linkedin.com", "sameSite": "no_restriction"}
+    assert "sameSite" not in _to_cdp_cookie(cookie)
+
+
+def test_to_cdp_cookie_reads_extension_expiration_date():
+    cookie = {"name": "li_at", "value": "abc", "domain": ".linkedin.com", "expirationDate": 1900000000.5}
+    assert _to_cdp_cookie(cookie)["expires"] == 1900000000.5
+
+
+def test_to_cdp_cookie_keeps_explicit_expires():
+    cookie = {"name": "li_at", "value": "abc", "domain": ".linkedin.com", "expires": 5, "expiry": 7}
+    assert _to_cdp_cookie(cookie)["expires"] == 5
+
+
+def test_to_cdp_cookie_without_domain_targets_linkedin():
+    cdp_cookie = _to_cdp_cookie({"name": "li_at", "value": "abc"})
+    assert cdp_cookie == {"name": "li_at", "value": "abc", "url": "https://www.linkedin.com"}
+
+
+@pytest.mark.parametrize("line,expected", [
+    ("Remote", ("Remote", None, None)),
+    ("San Francisco, CA · 2 weeks ago", ("San Francisco, CA", "2 weeks ago", None)),
+    ("San Francisco, CA · 2 weeks ago · 100 applicants", ("San Francisco, CA", "2 weeks ago", "100 applicants")),
+    ("New York, NY · 1 day ago · Over 100 applicants · Promoted by hirer",
+     ("New York, NY", "1 day ago", "Over 100 applicants")),
+])
+def test_tertiary_re_splits_segments(line, expected):
+    match = _TERTIARY_RE.match(line)
+    assert (match.group('loc'), match.group('posted'), match.group('applicants')) == expected
+
+
+def test_tertiary_re_rejects_empty_line():
+    assert _TERTIARY_RE.match("") is None
+
+
+def test_finalize_job_keeps_posting_age_with_extra_segments():
+    job = finalize_job(_raw_job(tertiary="New York, NY · 1 day ago · Over 100 applicants · Promoted by hirer"))
+    assert (job.location, job.posted_date) == ("New York, NY", "1 day ago")
+
+
+def test_fresh_login_waits_for_nav_before_checking(scraper, monkeypatch):
+    calls = []
+    scraper.driver = _UrlSequenceDriver(_LOGIN_URL, "https://www.linkedin.com/feed/")
+    monkeypatch.setattr(scraper, "_submit_login_form", lambda email=None: True)
+    monkeypatch.setattr(scraper, "_wait_visible", lambda selectors, timeout=10: calls.append(selectors) or True)
+    monkeypatch.setattr(scraper, "_is_logged_in", lambda: calls.append("checked") or True)
+
+    assert scraper._complete_fresh_login()
+    assert calls == [(".global-nav__primary-items",), "checked"]
+
+
+def test_fresh_login_on_challenge_skips_nav_wait(scraper, monkeypatch):
+    calls = []
+    scraper.driver = _UrlSequenceDriver(_LOGIN_URL, "https://www.linkedin.com/checkpoint/challenge/abc")
+    monkeypatch.setattr(scraper, "_submit_login_form", lambda email=None: True)
+    monkeypatch.setattr(scraper, "_wait_visible", lambda selectors, timeout=10: calls.append(selectors) or True)
+    monkeypatch.setattr(scraper, "_is_logged_in", lambda: False)
+
+    assert not scraper._complete_fresh_login()
+    assert calls == []
+
+
+def test_script_timeout_covers_a_full_card_batch():
+    driver = MagicMock()
+    LinkedInScraper(driver)
+
+    driver.set_script_timeout.assert_called_once_with(_SCRIPT_TIMEOUT)
+    assert _SCRIPT_TIMEOUT > _CARD_BATCH_SIZE * _CARD_SCRAPE_MAX_SECONDS
+
+
+def test_failed_seen_jobs_write_keeps_previous_file(tmp_path, monkeypatch):
+    seen_path = tmp_path / "seen_jobs.json"
+    seen_path.write_text("[1, 2]")
+    scraper = LinkedInScraper(None, seen_jobs_path=str(seen_path))
+    scraper._known_ids.add(3)
+
+    def dump_then_fail(obj, f):
+        f.write("[1, ")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(linkedin_scraper.json, "dump", dump_then_fail)
+    scraper._save_seen_job_ids()
+
+    assert seen_path.read_text() == "[1, 2]"
+    assert [p.name for p in tmp_path.iterdir()] == ["seen_jobs.json"]
+
+
+def _voyager_job(**overrides):
+    job = {"title": "Associate Product Manager", "company": "Company A", "location": "Remote",
+           "description": "Own the roadmap.\nShip it.", "listedAt": None, "applies": None}
+    job.update(overrides)
+    return job
+
+
+def test_voyager_fetch_maps_posting_age_and_applicants(scraper):
+    listed_at = (time.time() - 3 * 86400 - 60) * 1000
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: [_voyager_job(listedAt=listed_at, applies=57)])
+
+    details, = scraper._fetch_jobs_via_voyager(["101"])
+    job = scraper._job_from_panel_details(details, "https://www.linkedin.com/jobs/search/")
+
+    assert details["url"] == "https://www.linkedin.com/jobs/view/101/"
+    assert details["descriptionHtml"] == "Own the roadmap.<br>Ship it."
+    assert (job.location, job.posted_date) == ("Remote", "3 days ago")
+    assert job.get_platform_field("applicants_raw") == "57 applicants"
+
+
+@pytest.mark.parametrize("age_seconds,expected", [
+    (30, "Just now"), (60, "1 minute ago"), (2 * 3600, "2 hours ago"),
+    (86400, "1 day ago"), (15 * 86400, "2 weeks ago"), (65 * 86400, "2 months ago"),
+])
+def test_posted_ago_words_like_the_panel(age_seconds, expected):
+    assert _posted_ago(1_000_000_000_000, now=1_000_000_000 + age_seconds) == expected
+
+
+def test_voyager_tertiary_without_listed_at_is_location_only():
+    assert _voyager_tertiary(_voyager_job(applies=3)) == "Remote"
+
+
+def test_voyager_stays_on_after_a_batch_of_unusable_postings(scraper):
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: [None])
+
+    assert scraper._fetch_jobs_via_voyager(["101"]) == [None]
+    assert scraper._voyager_available
+
+
+def test_voyager_turns_off_after_consecutive_empty_batches(scraper):
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: [None, None])
+
+    for _ in range(_VOYAGER_MAX_EMPTY_BATCHES):
+        scraper._fetch_jobs_via_voyager(["101", "102"])
+
+    assert not scraper._voyager_available
+
+
+def test_voyager_empty_batch_count_resets_on_a_usable_batch(scraper):
+    responses = iter([[None], [_voyager_job()]] + [[None]] * (_VOYAGER_MAX_EMPTY_BATCHES - 1))
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: next(responses))
+
+    for _ in range(_VOYAGER_MAX_EMPTY_BATCHES + 1):
+        scraper._fetch_jobs_via_voyager(["101"])
+
+    assert scraper._voyager_available
+
+
+def test_voyager_turns_off_when_every_request_fails(scraper):
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: [{"failed": 403}, {"failed": 403}, None])
+
+    assert scraper._fetch_jobs_via_voyager(["101", "102", ""]) == [None, None, None]
+    assert not scraper._voyager_available
+
+
+def test_voyager_turns_off_when_the_script_raises(scraper):
+    def raise_error(script, ids):
+        raise RuntimeError("javascript error")
+    scraper.driver = SimpleNamespace(execute_async_script=raise_error)
+
+    assert scraper._fetch_jobs_via_voyager(["101"]) == [None]
+    assert not scraper._voyager_available
+
+
+def test_voyager_keeps_going_when_some_requests_fail(scraper):
+    scraper.driver = SimpleNamespace(execute_async_script=lambda script, ids: [{"failed": 404}, _voyager_job()])
+
+    first, second = scraper._fetch_jobs_via_voyager(["101", "102"])
+
+    assert first is None and second["title"] == "Associate Product Manager"
+    assert scraper._voyager_available
+
+
+_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+
+def _panel_details(job_id):
+    return {"title": f"Job {job_id}", "company": "Company A", "tertiary": "Remote · 1 day ago",
+            "descriptionHtml": "<p>Own the roadmap.</p>", "url": f"https://www.linkedin.com/jobs/view/{job_id}/?trk=x"}
+
+
+class _CardDriver:
+    """
+    Driver stub that answers the Voyager and card click scripts from the job ids it's given.
+    Voyager returns the jobs in `voyager`; clicked cards without an id are gone from the list.
+    """
+
+    def __init__(self, voyager=None, fail_clicks=()):
+        self.voyager = voyager or {}
+        self.fail_clicks = fail_clicks
+        self.clicked = []
+        self.visited = []
+
+    def execute_async_script(self, script, *args):
+        if script is linkedin_scraper._VOYAGER_JOBS_JS:
+            return [self.voyager.get(job_id) for job_id in args[0]]
+        _, indices, job_ids = args
+        self.clicked.append(list(indices))
+        if len(self.clicked) in self.fail_clicks:
+            raise TimeoutException("script timeout")
+        return [_panel_details(job_id) if job_id else None for job_id in job_ids]
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+@pytest.fixture
+def card_scraper(scraper, monkeypatch):
+    scraper.driver = _CardDriver()
+    scraper._voyager_available = False
+    monkeypatch.setattr(scraper, "_is_session_probably_valid", lambda: True)
+    return scraper
+
+
+def _scrape_cards(scraper, card_ids):
+    return list(scraper._scrape_cards(_SEARCH_URL, ".card", list(range(len(card_ids))), card_ids))
+
+
+def test_scrape_cards_clicks_in_batches_and_yields_in_card_order(card_scraper):
+    card_ids = [str(job_id) for job_id in range(1, 13)]
+
+    jobs = _scrape_cards(card_scraper, card_ids)
+
+    assert card_scraper.driver.clicked == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9], [10, 11]]
+    assert [job.url for job in jobs] == [f"https://www.linkedin.com/jobs/view/{job_id}/" for job_id in range(1, 13)]
+    assert card_scraper._known_ids == set(range(1, 13))
+
+
+def test_scrape_cards_skips_duplicates_and_missing_cards(card_scraper):
+    jobs = _scrape_cards(card_scraper, ["1", None, "1", "2"])
+
+    assert [job.title for job in jobs] == ["Job 1", "Job 2"]
+
+
+def test_scrape_cards_skips_panel_errors(card_scraper, monkeypatch):
+    monkeypatch.setattr(card_scraper, "_scrape_batch",
+                        lambda selector, indices, job_ids: [{"error": "panel did not switch"}, _panel_details("2")])
+
+    assert [job.title for job in _scrape_cards(card_scraper, ["1", "2"])] == ["Job 2"]
+
+
+def test_scrape_cards_moves_past_a_timed_out_batch(card_scraper):
+    card_scraper.driver = _CardDriver(fail_clicks={2})
+
+    jobs = _scrape_cards(card_scraper, [str(job_id) for job_id in range(1, 13)])
+
+    assert len(card_scraper.driver.clicked) == 3
+    assert [job.title for job in jobs] == [f"Job {job_id}" for job_id in (1, 2, 3, 4, 5, 11, 12)]
+
+
+def test_scrape_cards_stops_when_no_card_is_found(card_scraper):
+    jobs = _scrape_cards(card_scraper, [None] * 5 + ["6"])
+
+    assert jobs == []
+    assert card_scraper.driver.clicked == [[0, 1, 2, 3, 4]]
+
+
+def test_scrape_cards_checks_the_session_between_batches(card_scraper, monkeypatch):
+    checks = []
+    monkeypatch.setattr(card_scraper, "_is_session_probably_valid", lambda: checks.append(1) or True)
+
+    _scrape_cards(card_scraper, [str(job_id) for job_id in range(1, 13)])
+
+    assert len(checks) == 2
+
+
+def test_scrape_cards_reauthenticates_once_when_the_session_expires(card_scraper, monkeypatch):
+    auth_attempts, failures = [], []
+    monkeypatch.setattr(card_scraper, "_is_session_probably_valid", lambda: False)
+    monkeypatch.setattr(card_scraper, "authenticate_proactively", lambda: auth_attempts.append(1) or True)
+    monkeypatch.setattr(card_scraper, "_preload_job_list", lambda: None)
+    monkeypatch.setattr(card_scraper, "_send_auth_failure_notification", failures.append)
+
+    jobs = _scrape_cards(card_scraper, [str(job_id) for job_id in range(1, 16)])
+
+    assert len(auth_attempts) == 1
+    assert card_scraper.driver.visited == [_SEARCH_URL]
+    assert len(card_scraper.driver.clicked) == 2
+    assert len(jobs) == 10
+    assert failures == ["Session expired during job scraping"]
+
+
+def test_scrape_cards_stops_when_reauthentication_fails(card_scraper, monkeypatch):
+    failures = []
+    monkeypatch.setattr(card_scraper, "_is_session_probably_valid", lambda: False)
+    monkeypatch.setattr(card_scraper, "authenticate_proactively", lambda: False)
+    monkeypatch.setattr(card_scraper, "_send_auth_failure_notification", failures.append)
+
+    jobs = _scrape_cards(card_scraper, [str(job_id) for job_id in range(1, 13)])
+
+    assert len(jobs) == 5
+    assert card_scraper.driver.clicked == [[0, 1, 2, 3, 4]]
+    assert card_scraper.driver.visited == []
+    assert len(failures) == 1
+
+
+def test_scrape_batch_clicks_only_jobs_voyager_missed(scraper):
+    scraper.driver = _CardDriver(voyager={"2": _voyager_job(title="Product Manager")})
+
+    results = scraper._scrape_batch(".card", [0, 1, 2], ["1", "2", "3"])
+
+    assert scraper.driver.clicked == [[0, 2]]
+    assert [details["title"] for details in results] == ["Job 1", "Product Manager", "Job 3"]
+    assert results[1]["url"] == "https://www.linkedin.com/jobs/view/2/"
+
+
+def test_scrape_batch_skips_the_click_when_voyager_has_every_job(scraper):
+    scraper.driver = _CardDriver(voyager={"1": _voyager_job(), "2": _voyager_job()})
+
+    assert len(scraper._scrape_batch(".card", [0, 1], ["1", "2"])) == 2
+    assert scraper.driver.clicked == []
+
+
+def test_scrape_batch_returns_empty_when_no_card_is_found(scraper):
+    scraper.driver = _CardDriver()
+
+    assert scraper._scrape_batch(".card", [0, 1], [None, None]) == []
+
+
+def test_seen_jobs_file_round_trips_and_merges(tmp_path):
+    path = str(tmp_path / "seen_jobs.json")
+    first = LinkedInScraper(None, seen_jobs_path=path)
+    second = LinkedInScraper(None, seen_jobs_path=path)
+    assert first._known_ids == set()
+
+    first._known_ids |= {1, 2}
+    first._save_seen_job_ids()
+    second._known_ids.add(3)
+    second._save_seen_job_ids()
+
+    assert LinkedInScraper(None, seen_jobs_path=path)._known_ids == {1, 2, 3}
+    assert json.loads((tmp_path / "seen_jobs.json").read_text()) == [1, 2, 3]
+    assert [p.name for p in tmp_path.iterdir()] == ["seen_jobs.json"]
+
+
+def test_unreadable_seen_jobs_file_starts_empty(tmp_path):
+    path = tmp_path / "seen_jobs.json"
+    path.write_text("[1, 2")
+
+    assert LinkedInScraper(None, seen_jobs_path=str(path))._known_ids == set()
+
+
+def test_seen_jobs_are_not_saved_without_a_path(scraper, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper._known_ids.add(1)
+
+    scraper._save_seen_job_ids()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_parser(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(linkedin_scraper, "orjson", None)
+    elif linkedin_scraper.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_load_cookie_file_sanitizes_and_caches(json_parser, tmp_path):
+    path = tmp_path / "cookies.json"
+    path.write_text(json.dumps([
+        {"name": "li_at", "value": "abc", "domain": ".linkedin.com", "sameSite": "no_restriction"},
+        {"name": "JSESSIONID", "value": "def", "domain": ".linkedin.com", "sameSite": "Lax"},
+    ]))
+    scraper = LinkedInScraper(None, cookies_path=str(path))
+
+    cookies = scraper._load_cookie_file()
+    path.unlink()
+
+    assert ["sameSite" in cookie for cookie in cookies] == [False, True]
+    assert [cookie["name"] for cookie in scraper._cdp_cookies_cache] == ["li_at", "JSESSIONID"]
+    assert scraper._load_cookie_file() is cookies
+    with pytest.raises(FileNotFoundError):
+        scraper._load_cookie_file(refresh=True)
+
+
+def test_load_cookie_file_raises_json_error_on_bad_json(json_parser, tmp_path):
+    path = tmp_path / "cookies.json"
+    path.write_text("[{")
+
+    with pytest.raises(json.JSONDecodeError):
+        LinkedInScraper(None, cookies_path=str(path))._load_cookie_file()
+
+
+def _fake_scrape(self, url):
+    if "fail" in url:
+        raise RuntimeError("page did not load")
+    yield Job(title=url, company="Company A", location="Remote", description="",
+              url=url, search_url=url, platform="linkedin")
+
+
+def test_scrape_many_reuses_one_browser_per_worker(monkeypatch):
+    drivers = []
+    monkeypatch.setattr(LinkedInScraper, "scrape", _fake_scrape)
+    urls = [f"https://www.linkedin.com/jobs/search/?keywords={n}" for n in range(4)]
+
+    jobs = list(LinkedInScraper.scrape_many(urls, lambda: drivers.append(MagicMock()) or drivers[-1],
+                                            concurrency=1))
+
+    assert sorted(job.url for job in jobs) == urls
+    assert len(drivers) == 1
+    drivers[0].quit.assert_called_once()
+
+
+def test_scrape_many_skips_a_failed_url_and_closes_every_browser(monkeypatch):
+    drivers = []
+    monkeypatch.setattr(LinkedInScraper, "scrape", _fake_scrape)
+    urls = ["https://www.linkedin.com/jobs/search/?keywords=fail"] + [
+        f"https://www.linkedin.com/jobs/search/?keywords={n}" for n in range(3)]
+
+    jobs = list(LinkedInScraper.scrape_many(urls, lambda: drivers.append(MagicMock()) or drivers[-1],
+                                            concurrency=2))
+
+    assert sorted(job.url for job in jobs) == urls[1:]
+    assert 1 <= len(drivers) <= 2
+    for driver in drivers:
+        driver.quit.assert_called_once()
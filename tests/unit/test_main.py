@@ -0,0 +1,21 @@
+import logging
+from unittest.mock import MagicMock
+
+from src import main
+
+
+def test_setup_logging_starts_one_listener_across_calls(monkeypatch):
+    listener = MagicMock()
+    register = MagicMock()
+    monkeypatch.setattr(main, "_log_listener", None)
+    monkeypatch.setattr(main.logging.handlers, "QueueListener", listener)
+    monkeypatch.setattr(main.atexit, "register", register)
+    monkeypatch.setattr(main.logging, "basicConfig", MagicMock())
+    monkeypatch.setattr(logging.getLogger("httpx"), "level", logging.getLogger("httpx").level)
+
+    main.setup_logging()
+    main.setup_logging()
+
+    listener.assert_called_once()
+    listener.return_value.start.assert_called_once()
+    register.assert_called_once_with(listener.return_value.stop)
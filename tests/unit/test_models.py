@@ -0,0 +1,78 @@
+import dataclasses
+import pickle
+from datetime import datetime
+
+import pytest
+
+from src.scraper import models
+from src.scraper.models import Job
+
+# Large enough to be stored compressed
+_LONG_DESCRIPTION = "<p>Own the roadmap for our onboarding flow.</p>\n" * 100
+
+
+def _job(description=_LONG_DESCRIPTION, **kwargs):
+    return Job(title="Associate Product Manager", company="Company A", location="Remote",
+               description=description, url="https://www.linkedin.com/jobs/view/101/",
+               platform="linkedin", **kwargs)
+
+
+@pytest.mark.skipif(models.zstandard is None, reason="zstandard not installed")
+def test_long_description_is_stored_compressed():
+    job = _job()
+    stored = models._description_slot.__get__(job, Job)
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(_LONG_DESCRIPTION.encode())
+    assert job.description == _LONG_DESCRIPTION
+
+
+def test_short_description_is_stored_as_text():
+    job = _job(description="Desc 1")
+    assert models._description_slot.__get__(job, Job) == "Desc 1"
+    assert job.description == "Desc 1"
+
+
+def test_description_can_be_reassigned():
+    job = _job(description="Desc 1")
+    job.description = _LONG_DESCRIPTION
+    assert job.description == _LONG_DESCRIPTION
+
+
+def test_to_dict_round_trip():
+    job = _job(scraped_at_ns=1_700_000_000_000_000_000)
+    data = job.to_dict()
+
+    assert data["description"] == _LONG_DESCRIPTION
+    assert data["scraped_at"] == datetime.fromtimestamp(1_700_000_000).isoformat()
+    assert isinstance(data["description"], str)
+    assert set(data) == {"scraped_at" if f.name == "scraped_at_ns" else f.name for f in dataclasses.fields(Job)}
+    assert Job(**{k: v for k, v in data.items() if k != "scraped_at"}).description == _LONG_DESCRIPTION
+
+
+def test_scraped_at_is_built_from_nanoseconds():
+    job = _job(scraped_at_ns=1_700_000_000_500_000_000)
+    assert job.scraped_at == datetime.fromtimestamp(1_700_000_000.5)
+
+
+def test_scraped_at_ns_defaults_to_now():
+    before = datetime.now()
+    job = _job()
+    assert before <= job.scraped_at <= datetime.now()
+
+
+def test_replace_keeps_description():
+    job = dataclasses.replace(_job(), title="Product Manager")
+    assert job.title == "Product Manager"
+    assert job.description == _LONG_DESCRIPTION
+
+
+def test_asdict_has_plain_description():
+    data = dataclasses.asdict(_job())
+    assert isinstance(data["description"], str)
+    assert data["description"] == _LONG_DESCRIPTION
+    assert set(data) == {f.name for f in dataclasses.fields(Job)}
+
+
+def test_pickle_round_trip():
+    job = _job()
+    assert pickle.loads(pickle.dumps(job)) == job
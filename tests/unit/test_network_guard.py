@@ -0,0 +1,21 @@
+import socket
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def module_lookup_error():
+    # Module fixtures are set up before function-scoped ones, so this only sees the
+    # guard if conftest installs it for the whole session
+    with pytest.raises(RuntimeError) as excinfo:
+        socket.getaddrinfo("www.linkedin.com", 443)
+    return excinfo.value
+
+
+def test_network_blocked_in_module_fixtures(module_lookup_error):
+    assert "network access is disabled" in str(module_lookup_error)
+
+
+def test_network_blocked_in_tests():
+    with pytest.raises(RuntimeError):
+        socket.create_connection(("www.linkedin.com", 443), timeout=1)